@@ -2,10 +2,11 @@ from asyncio import iscoroutinefunction
 from functools import wraps
 from . import models
 
-from .error import InvalidToken, PageNotFound, BeingRateLimited, LoginFailed, InvalidCredentials, NoHookFound
+from .error import InvalidToken, PageNotFound, BeingRateLimited, LoginFailed, InvalidCredentials, NoHookFound, \
+    ClientNotStarted
 from .objects import create_tab_objects, create_community_objects, create_comment_objects, create_notification_objects,\
     create_media_object, create_post_objects, create_artist_objects, create_photo_objects, \
-    iterate_community_media_categories, create_announcement_object, create_video_objects
+    iterate_community_media_categories, create_announcement_object, create_video_objects, parse_timestamp
 
 __title__ = 'Weverse'
 __author__ = 'MujyKun'
@@ -40,6 +41,14 @@ def check_expired_token(func):
     return wrap_sync_function if not iscoroutinefunction(func) else wrap_async_function
 
 
+from .cache import CacheBackend, MemoryCacheStore, SQLiteCacheBackend
+from .scheduler import PollScheduler
+from .dispatcher import HookDispatcher
+from .ratelimit import TokenBucket, RateLimiter
+from .retry import RetryPolicy
+from .bus import EventBus, ContentEvent, PostCreated, ArtistCommentCreated, MediaCreated, AnnouncementCreated
+from .events import NotificationEvent, EventStream, StreamConsumer
 from .weverseclient import WeverseClient
 from .weversesync import WeverseClientSync
 from .weverseasync import WeverseClientAsync
+from .sharding import HashRing, ShardCoordinator
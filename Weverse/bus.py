@@ -0,0 +1,234 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from .models import Notification, Post, Comment, Media, Announcement
+
+
+class ContentEvent:
+    r"""The base class of the events that are published when new content is found through a notification.
+
+    Attributes
+    -----------
+    notification: :ref:`Notification`
+        The notification that the content was found through.
+    community_id: int
+        The ID of the community the content belongs to.
+    """
+    __slots__ = ('notification', 'community_id')
+
+    def __init__(self, notification: Optional[Notification], community_id: Optional[int]):
+        self.notification = notification
+        self.community_id = community_id
+
+    def __repr__(self):
+        return f"<{type(self).__name__} community_id={self.community_id}>"
+
+
+class PostCreated(ContentEvent):
+    r"""An artist made a new post.
+
+    Attributes
+    -----------
+    post: :ref:`Post`
+        The new post.
+    """
+    __slots__ = ('post',)
+
+    def __init__(self, post: Post, notification: Optional[Notification] = None):
+        community_id = post.community_id if post.community_id is not None else \
+            getattr(notification, 'community_id', None)
+        super().__init__(notification, community_id)
+        self.post = post
+
+
+class ArtistCommentCreated(ContentEvent):
+    r"""An artist commented on a post.
+
+    Attributes
+    -----------
+    comment: :ref:`Comment`
+        The new comment.
+    """
+    __slots__ = ('comment',)
+
+    def __init__(self, comment: Comment, notification: Optional[Notification] = None):
+        community_id = getattr(notification, 'community_id', None)
+        if community_id is None and comment.post is not None:
+            community_id = comment.post.community_id
+        super().__init__(notification, community_id)
+        self.comment = comment
+
+
+class MediaCreated(ContentEvent):
+    r"""New media was uploaded.
+
+    Attributes
+    -----------
+    media: :ref:`Media`
+        The new media.
+    """
+    __slots__ = ('media',)
+
+    def __init__(self, media: Media, notification: Optional[Notification] = None):
+        community_id = media.community_id if media.community_id is not None else \
+            getattr(notification, 'community_id', None)
+        super().__init__(notification, community_id)
+        self.media = media
+
+
+class AnnouncementCreated(ContentEvent):
+    r"""A new announcement was made.
+
+    Attributes
+    -----------
+    announcement: :ref:`Announcement`
+        The new announcement.
+    """
+    __slots__ = ('announcement',)
+
+    def __init__(self, announcement: Announcement, notification: Optional[Notification] = None):
+        community_id = announcement.community_id if announcement.community_id is not None else \
+            getattr(notification, 'community_id', None)
+        super().__init__(notification, community_id)
+        self.announcement = announcement
+
+
+class EventBus:
+    r"""
+    Calls the handlers that subscribed to a type of :class:`Weverse.bus.ContentEvent`.
+
+    Handlers subscribe to one event type and either one community or every community.
+    The handlers are indexed by (event type, community ID), so publishing an event only looks at the handlers
+    that are interested in it, no matter how many other handlers there are.
+
+    Parameters
+    ----------
+    verbose: bool
+        Whether to print out the exceptions raised by handlers.
+
+    Attributes
+    -----------
+    event_types: Dict[str, Type[:class:`Weverse.bus.ContentEvent`]]
+        The event type that is published for each notification type.
+    """
+    event_types: Dict[str, Type[ContentEvent]] = {
+        "post": PostCreated,
+        "tofans": PostCreated,
+        "comment": ArtistCommentCreated,
+        "media": MediaCreated,
+        "announcement": AnnouncementCreated
+    }
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self._handlers: Dict[Tuple[Type[ContentEvent], Optional[int]], List[Callable]] = {}
+        self._subscriber_counts: Dict[Type[ContentEvent], int] = {}
+
+    def subscribe(self, event_type: Type[ContentEvent], handler: Callable, community_id: Optional[int] = None):
+        """Call a handler with every event of a type.
+
+        :param event_type: The class of the events, such as :class:`Weverse.bus.PostCreated`.
+        :param handler: The method that is called with the event. May be a coroutine function
+            when the events are published by :ref:`WeverseClientAsync`.
+        :param community_id: Only call the handler for events of this community. Defaults to every community.
+        :returns: The handler.
+        """
+        if not isinstance(event_type, type) or not issubclass(event_type, ContentEvent):
+            raise TypeError("event_type must be a subclass of ContentEvent.")
+
+        self._handlers.setdefault((event_type, community_id), []).append(handler)
+        self._subscriber_counts[event_type] = self._subscriber_counts.get(event_type, 0) + 1
+        return handler
+
+    def unsubscribe(self, event_type: Type[ContentEvent], handler: Callable, community_id: Optional[int] = None):
+        """Stop calling a handler that was subscribed with the same event type and community.
+
+        :param event_type: The class of the events.
+        :param handler: The handler to remove.
+        :param community_id: The community the handler was subscribed to.
+        """
+        key = (event_type, community_id)
+        handlers = self._handlers.get(key)
+        if not handlers or handler not in handlers:
+            raise ValueError("The handler is not subscribed to this event type and community.")
+
+        handlers.remove(handler)
+        if not handlers:
+            del self._handlers[key]
+        self._subscriber_counts[event_type] -= 1
+
+    def has_subscribers(self, event_type: Type[ContentEvent]) -> bool:
+        """Whether any handler subscribed to an event type.
+
+        :param event_type: The class of the events.
+        :returns: bool
+        """
+        return self._subscriber_counts.get(event_type, 0) > 0
+
+    def handlers_for(self, event: ContentEvent) -> List[Callable]:
+        """Get the handlers of the community of an event followed by the handlers of every community.
+
+        :param event: The event.
+        :returns: List[Callable]
+        """
+        event_type = type(event)
+        handlers = []
+        if event.community_id is not None:
+            handlers.extend(self._handlers.get((event_type, event.community_id), ()))
+        handlers.extend(self._handlers.get((event_type, None), ()))
+        return handlers
+
+    def create_event(self, notification_type: Optional[str], contents,
+                     notification: Optional[Notification] = None) -> Optional[ContentEvent]:
+        """Create the event for the contents of a notification if any handler subscribed to it.
+
+        :param notification_type: The type of the notification. See :ref:`determine_notification_type`.
+        :param contents: The :ref:`Comment`, :ref:`Post`, :ref:`Media`, or :ref:`Announcement` of the notification.
+        :param notification: The notification.
+        :returns: Optional[:class:`Weverse.bus.ContentEvent`]
+        """
+        event_type = self.event_types.get(notification_type)
+        if contents is None or event_type is None or not self.has_subscribers(event_type):
+            return
+        return event_type(contents, notification)
+
+    def publish(self, event: ContentEvent):
+        """Call the handlers of an event.
+
+        Coroutine handlers are not awaited, use `publish_async` for them.
+
+        :param event: The event.
+        """
+        for handler in self.handlers_for(event):
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    result.close()
+                    raise TypeError("Coroutine handlers need publish_async.")
+            except Exception as e:
+                if self.verbose:
+                    print(f"A handler of {type(event).__name__} raised an exception - {e}")
+
+    async def publish_async(self, event: ContentEvent):
+        """Call the handlers of an event and await the coroutine handlers at the same time.
+
+        This is a coroutine and must be awaited.
+
+        :param event: The event.
+        """
+        coroutines = []
+        for handler in self.handlers_for(event):
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    coroutines.append(result)
+            except Exception as e:
+                if self.verbose:
+                    print(f"A handler of {type(event).__name__} raised an exception - {e}")
+
+        if not coroutines:
+            return
+
+        for result in await asyncio.gather(*coroutines, return_exceptions=True):
+            if isinstance(result, Exception) and self.verbose:
+                print(f"A handler of {type(event).__name__} raised an exception - {result}")
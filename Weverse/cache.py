@@ -0,0 +1,602 @@
+import io
+import pickle
+import sqlite3
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime
+from collections.abc import MutableMapping
+from functools import partial
+from typing import Optional, List, Iterable, Dict, Callable, Set, TYPE_CHECKING
+
+from .models import Artist, Community, Post
+
+if TYPE_CHECKING:
+    from . import WeverseClient
+
+
+class CacheBackend:
+    r"""
+    Creates the stores that hold the object caches of a :ref:`WeverseClient`.
+
+    This default backend keeps every object in memory with a :class:`Weverse.cache.MemoryCacheStore`.
+    A different backend may be passed into the client with the `cache_backend` keyword argument.
+
+    Parameters
+    ----------
+    limits: Dict[str, dict]
+        The limits of each cache where the cache name (such as "posts" or "notifications") is the key and the value
+        is a dict with an optional `max_size` (amount of objects) and an optional `ttl` (seconds).
+        EX: {"posts": {"max_size": 50000}, "notifications": {"ttl": 604800}}
+
+    Attributes
+    -----------
+    keeps_objects_in_memory: bool
+        Whether every cached object stays in memory.
+        If this is False, :class:`models.Artist.posts` is not filled since it would keep every post in memory.
+    """
+    keeps_objects_in_memory = True
+
+    def __init__(self, limits: Dict[str, dict] = None):
+        self._limits = limits or {}
+
+    def create_store(self, name: str, client: 'WeverseClient') -> MutableMapping:
+        """
+        Create the store for a cache.
+
+        :param name: The name of the cache (such as "posts" or "photos").
+        :param client: The :ref:`WeverseClient` the cache belongs to.
+        :returns: A mutable mapping of the object key to the object.
+        """
+        limits = self._limits.get(name) or {}
+        return MemoryCacheStore(max_size=limits.get("max_size"), ttl=limits.get("ttl"),
+                                on_evict=partial(client._on_cache_eviction, name))
+
+    def flush(self):
+        """Write any pending changes to the backend."""
+
+    def close(self):
+        """Flush and close the backend."""
+        self.flush()
+
+
+class MemoryCacheStore(OrderedDict):
+    r"""
+    An in-memory mapping that may evict the least recently used objects and objects that are too old.
+
+    It is not suggested to create a store manually, but rather through :class:`Weverse.cache.CacheBackend`.
+
+    Expired objects are removed whenever an object is stored, and are never returned when they are read
+    or reported as present by `in`.
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum amount of objects to keep. The least recently used objects are evicted first.
+    ttl: float
+        The amount of seconds an object is kept after it was last stored.
+    on_evict: Callable
+        A method that will be called with the key and the object whenever an object is evicted.
+
+    Attributes
+    -----------
+    hits: int
+        The amount of reads that found an object.
+    misses: int
+        The amount of reads that did not find an object.
+    evictions: int
+        The amount of objects that were evicted.
+    """
+    def __init__(self, max_size: int = None, ttl: float = None, on_evict: Callable = None):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stored_at: OrderedDict = OrderedDict()
+
+    def __getitem__(self, key):
+        try:
+            value = super().__getitem__(key)
+        except KeyError:
+            self.misses += 1
+            raise
+
+        if self.ttl and time.monotonic() - self._stored_at.get(key, time.monotonic()) > self.ttl:
+            self._evict(key)
+            self.misses += 1
+            raise KeyError(key)
+
+        self.hits += 1
+        if self.max_size:
+            self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if self.max_size:
+            self.move_to_end(key)
+        if self.ttl:
+            self._stored_at[key] = time.monotonic()
+            self._stored_at.move_to_end(key)
+
+        self.evict_expired()
+        while self.max_size and len(self) > self.max_size:
+            self._evict(next(iter(self)))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._stored_at.pop(key, None)
+
+    def load(self, objects: dict):
+        """
+        Store many objects at once, such as the objects of a snapshot.
+
+        The size and age limits are only applied once every object was stored, instead of after each object.
+
+        :param objects: The objects where the key of the object is the key.
+        """
+        set_item = super().__setitem__
+        for key, value in objects.items():
+            set_item(key, value)
+        if self.ttl:
+            self._stored_at.update(dict.fromkeys(objects, time.monotonic()))
+
+        self.evict_expired()
+        while self.max_size and len(self) > self.max_size:
+            self._evict(next(iter(self)))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        if not super().__contains__(key):
+            return False
+        if self.ttl and time.monotonic() - self._stored_at.get(key, time.monotonic()) > self.ttl:
+            self._evict(key)
+            return False
+        return True
+
+    def __iter__(self):
+        self.evict_expired()
+        return super().__iter__()
+
+    def keys(self):
+        self.evict_expired()
+        return super().keys()
+
+    def values(self):
+        self.evict_expired()
+        return super().values()
+
+    def items(self):
+        self.evict_expired()
+        return super().items()
+
+    def pop(self, key, *args):
+        self._stored_at.pop(key, None)
+        return super().pop(key, *args)
+
+    def popitem(self, last=True):
+        key, value = super().popitem(last)
+        self._stored_at.pop(key, None)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._stored_at.clear()
+
+    def evict_expired(self):
+        """Evict the objects that were stored longer than the ttl ago."""
+        if not self.ttl:
+            return
+
+        oldest_allowed = time.monotonic() - self.ttl
+        while self._stored_at:
+            key, stored_at = next(iter(self._stored_at.items()))
+            if stored_at >= oldest_allowed:
+                break
+            self._evict(key)
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the store.
+
+        :returns: dict with the hits, misses, evictions, and size.
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self)}
+
+    def _evict(self, key):
+        """Remove an object and let the owner clean up references to it."""
+        value = super().pop(key)
+        self._stored_at.pop(key, None)
+        self.evictions += 1
+        if self.on_evict:
+            self.on_evict(key, value)
+
+    def __reduce__(self):
+        # the eviction callback belongs to a client, so only the objects are kept.
+        return dict, (dict(self),)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    r"""
+    A cache backend that stores objects in an SQLite database so the cache may be larger than the memory available.
+
+    Each cache is a table that is indexed by the object ID, community ID, artist ID, and creation time.
+    The most recently used objects are kept in memory in front of the database.
+
+    Since the objects are pickled, only use a database that was created by yourself.
+
+    Parameters
+    ----------
+    path: str
+        The file path of the database. Defaults to an in-memory database.
+    hot_size: int
+        The amount of objects of each cache that are kept in memory. Defaults to 1000.
+    caches: Iterable[str]
+        The names of the caches that are stored in the database. The other caches are kept in memory.
+        Defaults to posts, photos, comments, notifications, videos, media, and announcements.
+
+    Attributes
+    -----------
+    connection: :class:`sqlite3.Connection`
+        The connection to the database.
+    """
+    keeps_objects_in_memory = False
+
+    def __init__(self, path: str = ":memory:", hot_size: int = 1000, caches: Iterable[str] = None):
+        super().__init__()
+        self.connection = sqlite3.connect(path)
+        self._hot_size = hot_size
+        self._cache_names = set(caches or ["posts", "photos", "comments", "notifications", "videos", "media",
+                                           "announcements"])
+        self._stores: List[SQLiteCacheStore] = []
+
+    def create_store(self, name: str, client: 'WeverseClient') -> MutableMapping:
+        """
+        Create the store for a cache.
+
+        :param name: The name of the cache (such as "posts" or "photos").
+        :param client: The :ref:`WeverseClient` the cache belongs to.
+        :returns: A mutable mapping of the object key to the object.
+        """
+        if name not in self._cache_names:
+            return super().create_store(name, client)
+
+        store = SQLiteCacheStore(self.connection, name, client, self._hot_size)
+        self._stores.append(store)
+        return store
+
+    def flush(self):
+        """Write the objects that only exist in memory to the database."""
+        for store in self._stores:
+            store.flush()
+
+    def close(self):
+        """Flush and close the database."""
+        self.flush()
+        self.connection.close()
+
+
+class SQLiteCacheStore(MutableMapping):
+    r"""
+    A mutable mapping that keeps its objects in an SQLite table with the most recently used objects in memory.
+
+    It is not suggested to create a store manually, but rather through :class:`Weverse.cache.SQLiteCacheBackend`.
+
+    Objects that are stored are only written to the database once they leave memory or the store is flushed.
+    An object that is changed after it was read from the store must be stored again for the change to be kept.
+
+    References to artists, communities, and other posts are not stored with an object.
+    They are looked up from the client when the object is read.
+
+    Parameters
+    ----------
+    connection: :class:`sqlite3.Connection`
+        The connection to the database.
+    name: str
+        The name of the cache and table.
+    client: :ref:`WeverseClient`
+        The client the cache belongs to.
+    hot_size: int
+        The amount of objects that are kept in memory.
+
+    Attributes
+    -----------
+    hits: int
+        The amount of reads that found an object in memory.
+    misses: int
+        The amount of reads that had to go to the database, including reads of objects that do not exist.
+    evictions: int
+        The amount of objects that were moved from memory to the database.
+    """
+    def __init__(self, connection: sqlite3.Connection, name: str, client: 'WeverseClient', hot_size: int = 1000):
+        self._connection = connection
+        self._table = name
+        self._client = client
+        self._hot_size = hot_size
+        self._hot: OrderedDict = OrderedDict()
+        self._dirty = set()
+        self._pending_writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS {self._table} (key PRIMARY KEY, community_id INTEGER, "
+                                 f"artist_id INTEGER, created_at, data BLOB NOT NULL)")
+        self._connection.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_community "
+                                 f"ON {self._table} (community_id, created_at)")
+        self._connection.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_artist "
+                                 f"ON {self._table} (artist_id, created_at)")
+        self._connection.commit()
+
+    def __getitem__(self, key):
+        obj = self._hot.get(key)
+        if obj is not None:
+            self.hits += 1
+            self._hot.move_to_end(key)
+            return obj
+
+        self.misses += 1
+        row = self._connection.execute(f"SELECT data FROM {self._table} WHERE key = ?", (key,)).fetchone()
+        if not row:
+            raise KeyError(key)
+
+        obj = self._loads(row[0])
+        self._add_to_hot(key, obj, dirty=False)
+        return obj
+
+    def __setitem__(self, key, obj):
+        self._add_to_hot(key, obj, dirty=True)
+
+    def __delitem__(self, key):
+        in_memory = self._hot.pop(key, None) is not None
+        self._dirty.discard(key)
+        cursor = self._connection.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+        self._pending_writes += 1
+        if not in_memory and not cursor.rowcount:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self._hot:
+            return True
+        return self._connection.execute(f"SELECT 1 FROM {self._table} WHERE key = ?", (key,)).fetchone() is not None
+
+    def __iter__(self):
+        self.flush()
+        for (key,) in self._connection.execute(f"SELECT key FROM {self._table}").fetchall():
+            yield key
+
+    def __len__(self):
+        self.flush()
+        return self._connection.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def find(self, community_id: int = None, artist_id: int = None, limit: int = None) -> list:
+        """
+        Find the objects of a community and/or artist using the database indexes.
+
+        :param community_id: The ID of the community the objects belong to.
+        :param artist_id: The ID of the artist the objects belong to.
+        :param limit: The maximum amount of objects to return.
+        :returns: A list of objects ordered by when they were created (newest first).
+        """
+        self.flush()
+        conditions, parameters = [], []
+        if community_id is not None:
+            conditions.append("community_id = ?")
+            parameters.append(community_id)
+        if artist_id is not None:
+            conditions.append("artist_id = ?")
+            parameters.append(artist_id)
+
+        query = f"SELECT key FROM {self._table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return [self[key] for (key,) in self._connection.execute(query, parameters).fetchall()]
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the store.
+
+        :returns: dict with the hits, misses, evictions, and the size of the in-memory layer.
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._hot)}
+
+    def flush(self):
+        """Write the objects that were stored in memory to the database."""
+        for key in list(self._dirty):
+            self._write(key, self._hot[key])
+        self._dirty.clear()
+        if self._pending_writes:
+            self._connection.commit()
+            self._pending_writes = 0
+
+    def _add_to_hot(self, key, obj, dirty: bool):
+        """Add an object to memory and move the least recently used objects to the database."""
+        self._hot[key] = obj
+        self._hot.move_to_end(key)
+        if dirty:
+            self._dirty.add(key)
+
+        while len(self._hot) > self._hot_size:
+            old_key, old_obj = self._hot.popitem(last=False)
+            self.evictions += 1
+            if old_key in self._dirty:
+                self._dirty.discard(old_key)
+                self._write(old_key, old_obj)
+
+        if self._pending_writes >= 1000:
+            self._connection.commit()
+            self._pending_writes = 0
+
+    def _write(self, key, obj):
+        """Write an object to the database."""
+        community_id, artist_id = self._get_owner_ids(obj)
+        created_at = getattr(obj, "created_at", None)
+        if isinstance(created_at, datetime):
+            created_at = created_at.timestamp()
+        self._connection.execute(f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?, ?)",
+                                 (key, community_id, artist_id, created_at, self._dumps(obj)))
+        self._pending_writes += 1
+
+    @staticmethod
+    def _get_owner_ids(obj):
+        """Get the community ID and artist ID an object belongs to."""
+        community_id = getattr(obj, "community_id", None)
+        artist_id = getattr(obj, "artist_id", None)
+        post = getattr(obj, "post", None)
+        artist: Optional[Artist] = getattr(obj, "artist", None) or getattr(post, "artist", None)
+        if artist:
+            community_id = community_id if community_id is not None else artist.community_id
+            artist_id = artist_id if artist_id is not None else artist.id
+        return community_id, artist_id
+
+    @staticmethod
+    def _dumps(obj) -> bytes:
+        """Pickle an object without the objects it references from other caches."""
+        file = io.BytesIO()
+        _ModelPickler(file, obj).dump(obj)
+        return file.getvalue()
+
+    def _loads(self, data: bytes):
+        """Unpickle an object and look up the objects it references from the client."""
+        return _ModelUnpickler(io.BytesIO(data), self._client).load()
+
+
+class TimeIndex:
+    r"""
+    An index of object IDs ordered by a timestamp that answers range queries with bisection.
+
+    New entries are appended and the index is only sorted again once it is queried,
+    so adding many objects at once does not pay for an insertion into a sorted list each time.
+    Removed entries are skipped by queries and dropped once they make up half of the index.
+    Adding an object again with the timestamp of a removed entry reuses that entry.
+    An ID is in the index at most once.
+    """
+    def __init__(self):
+        self._entries: List[tuple] = []  # (timestamp, object id), may contain removed entries.
+        self._removed: Set[tuple] = set()  # the removed entries that are still in _entries.
+        self._timestamps: Dict[object, float] = {}
+        self._sorted = True
+
+    def add(self, object_id, timestamp: float):
+        """Add an object to the index or move it if its timestamp changed.
+
+        :param object_id: The ID of the object.
+        :param timestamp: The epoch timestamp of the object.
+        """
+        old_timestamp = self._timestamps.get(object_id)
+        if old_timestamp == timestamp:
+            return
+
+        self._timestamps[object_id] = timestamp
+        if old_timestamp is not None:
+            self._removed.add((old_timestamp, object_id))
+
+        entry = (timestamp, object_id)
+        if entry in self._removed:
+            self._removed.discard(entry)
+        else:
+            if self._entries and entry < self._entries[-1]:
+                self._sorted = False
+            self._entries.append(entry)
+
+        if old_timestamp is not None:
+            self._compact_if_needed()
+
+    def add_many(self, entries: Iterable[tuple]):
+        """Add many objects at once, which sorts the index only once when it was empty.
+
+        :param entries: The (epoch timestamp, object ID) of each object.
+        """
+        if self._timestamps:
+            for timestamp, object_id in entries:
+                self.add(object_id, timestamp)
+            return
+
+        self._timestamps = {object_id: timestamp for timestamp, object_id in entries}
+        self._entries = sorted((timestamp, object_id) for object_id, timestamp in self._timestamps.items())
+        self._removed = set()
+        self._sorted = True
+
+    def remove(self, object_id):
+        """Remove an object from the index if it is in it.
+
+        :param object_id: The ID of the object.
+        """
+        timestamp = self._timestamps.pop(object_id, None)
+        if timestamp is not None:
+            self._removed.add((timestamp, object_id))
+            self._compact_if_needed()
+
+    def between(self, start: float = None, end: float = None) -> list:
+        """Get the IDs of the objects with a timestamp from `start` up to (but not including) `end`.
+
+        :param start: The epoch timestamp to start from. Unbounded if None.
+        :param end: The epoch timestamp to end at. Unbounded if None.
+        :returns: A list of object IDs from the oldest to the newest.
+        """
+        if not self._sorted:
+            self._entries.sort()
+            self._sorted = True
+
+        low = 0 if start is None else bisect_left(self._entries, (start,))
+        high = len(self._entries) if end is None else bisect_left(self._entries, (end,))
+        removed = self._removed
+        if not removed:
+            return [object_id for timestamp, object_id in self._entries[low:high]]
+        return [entry[1] for entry in self._entries[low:high] if entry not in removed]
+
+    def _compact_if_needed(self):
+        """Drop the removed entries once they make up half of the index."""
+        if len(self._removed) > len(self._timestamps) + 64:
+            removed = self._removed
+            self._entries = [entry for entry in self._entries if entry not in removed]
+            self._removed = set()
+
+    def __len__(self):
+        return len(self._timestamps)
+
+
+class _ModelPickler(pickle.Pickler):
+    """Pickles an object while replacing references to artists, communities, and other posts with their IDs."""
+    def __init__(self, file, root):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._root = root
+
+    def persistent_id(self, obj):
+        if obj is self._root:
+            return None
+        if isinstance(obj, Artist):
+            return "artist", obj.id
+        if isinstance(obj, Community):
+            return "community", obj.id
+        if isinstance(obj, Post):
+            return "post", obj.id
+        return None
+
+
+class _ModelUnpickler(pickle.Unpickler):
+    """Unpickles an object that was pickled by :class:`_ModelPickler`."""
+    def __init__(self, file, client: 'WeverseClient'):
+        super().__init__(file)
+        self._client = client
+
+    def persistent_load(self, pid):
+        object_type, object_id = pid
+        if object_type == "artist":
+            return self._client.all_artists.get(object_id)
+        if object_type == "community":
+            return self._client.all_communities.get(object_id)
+        if object_type == "post":
+            return self._client.all_posts.get(object_id)
+        raise pickle.UnpicklingError(f"Unknown persistent object type {object_type}.")
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+
+class HookDispatcher:
+    r"""
+    Runs the hook of a :ref:`WeverseClientAsync` in worker tasks so that a slow hook does not delay polling.
+
+    The hook loop puts every batch of new notifications in a bounded queue and a pool of workers calls the hook
+    with them. With more than one worker, batches may be handled at the same time and finish out of order.
+
+    When the queue is full, the backpressure policy decides what happens to a new batch:
+
+    - "block": The hook loop waits until a worker takes a batch from the queue.
+    - "drop_oldest": The oldest batch in the queue is dropped to make room.
+    - "coalesce": The new notifications are added to the newest batch in the queue.
+
+    Parameters
+    ----------
+    hook: Callable
+        The method that is called with each list of :class:`models.Notification`. May be a coroutine function.
+    workers: int
+        The amount of worker tasks that call the hook. Defaults to 1.
+    max_queue_size: int
+        The maximum amount of batches waiting for a worker. Defaults to 100.
+    policy: str
+        "block", "drop_oldest", or "coalesce". Defaults to "block".
+    verbose: bool
+        Whether to print out the exceptions raised by the hook.
+
+    Attributes
+    -----------
+    batches_dispatched: int
+        The amount of batches put in the queue.
+    batches_dropped: int
+        The amount of batches dropped by the "drop_oldest" policy.
+    batches_coalesced: int
+        The amount of batches added to another batch by the "coalesce" policy.
+    hook_calls: int
+        The amount of times the hook finished.
+    hook_errors: int
+        The amount of times the hook raised an exception.
+    max_queue_depth: int
+        The most batches that were waiting in the queue at once.
+    """
+    policies = ("block", "drop_oldest", "coalesce")
+
+    def __init__(self, hook: Callable, workers: int = 1, max_queue_size: int = 100, policy: str = "block",
+                 verbose: bool = False):
+        if policy not in self.policies:
+            raise ValueError(f"policy must be one of {', '.join(self.policies)}.")
+        if workers < 1 or max_queue_size < 1:
+            raise ValueError("workers and max_queue_size must be at least 1.")
+
+        self.hook = hook
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.verbose = verbose
+
+        self.batches_dispatched = 0
+        self.batches_dropped = 0
+        self.batches_coalesced = 0
+        self.hook_calls = 0
+        self.hook_errors = 0
+        self.max_queue_depth = 0
+        self._total_hook_time = 0.0
+        self._max_hook_time = 0.0
+
+        self._batches: Deque[list] = deque()
+        self._condition: Optional[asyncio.Condition] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._closed = False
+
+    @property
+    def queue_depth(self) -> int:
+        """The amount of batches waiting for a worker."""
+        return len(self._batches)
+
+    def start(self):
+        """Start the worker tasks. Must be called from a running event loop."""
+        if self._worker_tasks:
+            return
+
+        self._closed = False
+        self._condition = asyncio.Condition()
+        self._worker_tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def dispatch(self, notifications: list):
+        """Put a batch of notifications in the queue for the workers.
+
+        This is a coroutine and must be awaited.
+
+        :param notifications: List[:class:`models.Notification`]
+        """
+        if not self._worker_tasks:
+            self.start()
+
+        async with self._condition:
+            if len(self._batches) >= self.max_queue_size:
+                if self.policy == "block":
+                    await self._condition.wait_for(lambda: len(self._batches) < self.max_queue_size)
+                elif self.policy == "drop_oldest":
+                    self._batches.popleft()
+                    self.batches_dropped += 1
+                else:
+                    self._batches[-1].extend(notifications)
+                    self.batches_coalesced += 1
+                    return
+
+            self._batches.append(list(notifications))
+            self.batches_dispatched += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self._batches))
+            self._condition.notify_all()
+
+    async def stop(self, drain: bool = True):
+        """Stop the worker tasks.
+
+        This is a coroutine and must be awaited.
+
+        :param drain: Whether the batches that are still queued should be handled first.
+        """
+        if not self._worker_tasks:
+            return
+
+        async with self._condition:
+            if not drain:
+                self._batches.clear()
+            self._closed = True
+            self._condition.notify_all()
+
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    def stats(self) -> dict:
+        """
+        Get the metrics of the dispatcher.
+
+        :returns: dict with the queue depth, batch counters, and hook durations in seconds.
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "batches_dispatched": self.batches_dispatched,
+            "batches_dropped": self.batches_dropped,
+            "batches_coalesced": self.batches_coalesced,
+            "hook_calls": self.hook_calls,
+            "hook_errors": self.hook_errors,
+            "average_hook_time": self._total_hook_time / self.hook_calls if self.hook_calls else 0.0,
+            "max_hook_time": self._max_hook_time
+        }
+
+    async def _work(self):
+        """Call the hook with queued batches until the dispatcher is stopped."""
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._batches or self._closed)
+                if not self._batches:
+                    return
+                batch = self._batches.popleft()
+                self._condition.notify_all()  # a blocked dispatch may continue.
+
+            start_time = time.perf_counter()
+            try:
+                result = self.hook(batch)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.hook_errors += 1
+                if self.verbose:
+                    print(f"The hook raised an exception - {e}")
+            finally:
+                hook_time = time.perf_counter() - start_time
+                self.hook_calls += 1
+                self._total_hook_time += hook_time
+                self._max_hook_time = max(self._max_hook_time, hook_time)
@@ -39,3 +39,9 @@ class NoHookFound(Exception):
     """An Exception raised when a loop for the hook was started but did not actually have a hook method."""
     def __init__(self, msg: str = "No Hook was passed into the Weverse client."):
         super(NoHookFound, self).__init__(msg)
+
+
+class ClientNotStarted(Exception):
+    """An Exception raised when the client was used before it was started and has no web session."""
+    def __init__(self, msg: str = "The Weverse client was not started."):
+        super(ClientNotStarted, self).__init__(msg)
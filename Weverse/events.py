@@ -0,0 +1,169 @@
+import asyncio
+from collections import deque
+from typing import Deque, Optional, Union
+
+from .models import Notification, Post, Comment, Media, Announcement
+
+
+class NotificationEvent:
+    r"""A new notification together with the object it is about.
+
+    Parameters
+    ----------
+    notification: :ref:`Notification`
+        The notification.
+    notification_type: str
+        "comment", "post", "media", "announcement", or None if the type is unknown.
+    contents:
+        The :ref:`Comment`, :ref:`Post`, :ref:`Media`, or :ref:`Announcement` that the notification is about.
+        None if it could not be fetched.
+
+    Attributes
+    -----------
+    sequence: int
+        The position of the event in the stream it was published to.
+    notification: :ref:`Notification`
+        The notification.
+    notification_type: str
+        "comment", "post", "media", "announcement", or None if the type is unknown.
+    contents:
+        The :ref:`Comment`, :ref:`Post`, :ref:`Media`, or :ref:`Announcement` that the notification is about.
+        None if it could not be fetched.
+    """
+    __slots__ = ('sequence', 'notification', 'notification_type', 'contents')
+
+    def __init__(self, notification: Notification, notification_type: Optional[str],
+                 contents: Optional[Union[Post, Comment, Media, Announcement]]):
+        self.sequence: Optional[int] = None
+        self.notification = notification
+        self.notification_type = notification_type
+        self.contents = contents
+
+    def __repr__(self):
+        return f"<NotificationEvent sequence={self.sequence} type={self.notification_type} " \
+               f"notification={self.notification.id}>"
+
+
+class EventStream:
+    r"""A ring buffer of the most recent events that several consumers read at their own pace.
+
+    Every consumer has its own cursor, so a slow consumer does not hold back the others.
+    A consumer that falls further behind than the size of the buffer skips the events it missed.
+
+    Parameters
+    ----------
+    buffer_size: int
+        The amount of most recent events that are kept. Defaults to 1000.
+    """
+    def __init__(self, buffer_size: int = 1000):
+        self._events: Deque[NotificationEvent] = deque(maxlen=buffer_size)
+        self._next_sequence = 0
+        self._waiter: Optional[asyncio.Event] = None
+        self.closed = False
+
+    @property
+    def oldest_sequence(self) -> int:
+        """The sequence of the oldest event still in the buffer."""
+        return self._next_sequence - len(self._events)
+
+    @property
+    def next_sequence(self) -> int:
+        """The sequence the next published event will have."""
+        return self._next_sequence
+
+    def publish(self, event: NotificationEvent):
+        """Add an event to the stream and wake up the consumers waiting for it.
+
+        :param event: The event to publish.
+        """
+        event.sequence = self._next_sequence
+        self._next_sequence += 1
+        self._events.append(event)
+        self._wake_consumers()
+
+    def subscribe(self, from_start: bool = False) -> 'StreamConsumer':
+        """Create a consumer with its own cursor.
+
+        :param from_start: Whether to start from the oldest event in the buffer instead of the next new event.
+        :returns: :class:`Weverse.events.StreamConsumer`
+        """
+        return StreamConsumer(self, self.oldest_sequence if from_start else self._next_sequence)
+
+    def open(self):
+        """Allow consumers to wait for new events again after the stream was closed."""
+        self.closed = False
+
+    def close(self):
+        """End the iteration of every consumer once it has read the events in the buffer."""
+        self.closed = True
+        self._wake_consumers()
+
+    def get(self, sequence: int) -> Optional[NotificationEvent]:
+        """Get the event with a sequence if it is still in the buffer.
+
+        :param sequence: The sequence of the event.
+        :returns: Optional[:class:`Weverse.events.NotificationEvent`]
+        """
+        oldest_sequence = self.oldest_sequence
+        if oldest_sequence <= sequence < self._next_sequence:
+            return self._events[sequence - oldest_sequence]
+
+    async def wait(self):
+        """Wait until an event is published or the stream is closed.
+
+        This is a coroutine and must be awaited.
+        """
+        if not self._waiter:
+            self._waiter = asyncio.Event()
+        await self._waiter.wait()
+
+    def _wake_consumers(self):
+        if self._waiter:
+            self._waiter.set()
+            self._waiter = None
+
+
+class StreamConsumer:
+    r"""An asynchronous iterator over the events of an :class:`Weverse.events.EventStream` with its own cursor.
+
+    Parameters
+    ----------
+    stream: :class:`Weverse.events.EventStream`
+        The stream to read.
+    cursor: int
+        The sequence of the first event to read.
+
+    Attributes
+    -----------
+    cursor: int
+        The sequence of the next event to read.
+    missed: int
+        The amount of events that were dropped from the buffer before they were read.
+    """
+    def __init__(self, stream: EventStream, cursor: int):
+        self._stream = stream
+        self.cursor = cursor
+        self.missed = 0
+
+    @property
+    def lag(self) -> int:
+        """The amount of published events that were not read yet."""
+        return self._stream.next_sequence - self.cursor
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> NotificationEvent:
+        while self.cursor >= self._stream.next_sequence:
+            if self._stream.closed:
+                raise StopAsyncIteration
+            await self._stream.wait()
+
+        oldest_sequence = self._stream.oldest_sequence
+        if self.cursor < oldest_sequence:
+            self.missed += oldest_sequence - self.cursor
+            self.cursor = oldest_sequence
+
+        event = self._stream.get(self.cursor)
+        self.cursor += 1
+        return event
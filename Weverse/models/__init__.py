@@ -1,3 +1,5 @@
+from .lazy import LazyModel
+from .collection import PostCollection
 from .comment import Comment
 from .artist import Artist
 from .community import Community
@@ -5,6 +7,6 @@ from .notification import Notification
 from .photo import Photo
 from .tab import Tab
 from .video import Video, VideoStream
-from .post import Post
+from .post import Post, LazyPost
 from .media import Media
 from .announcement import Announcement
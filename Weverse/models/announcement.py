@@ -67,6 +67,9 @@ class Announcement:
         Body Content without the HTML tags.
 
     """
+    __slots__ = ('id', 'community_id', 'title', 'html_content', 'created_at', 'exposed_at', 'category_id', 'fc_only',
+                 'image_url', 'content', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get("id")
         self.community_id = kwargs.get("communityId")
@@ -1,5 +1,7 @@
 from typing import Optional, TYPE_CHECKING
 
+from .collection import PostCollection
+
 if TYPE_CHECKING:
     from Weverse.models import Community
 
@@ -66,8 +68,8 @@ class Artist:
         A direct image url to the artist's birthday image.
     community: Community
         The community the Artist is in.
-    posts: :class:`list`
-        A list of posts the Artist has.
+    posts: :class:`Weverse.models.PostCollection`
+        The posts the Artist has in the order they were added. It is a list that holds every post at most once.
 
     Attributes
     -----------
@@ -109,9 +111,14 @@ class Artist:
         A direct image url to the artist's birthday image.
     community: Community
         The community the Artist is in.
-    posts: list
-        A list of posts the Artist has.
+    posts: PostCollection
+        The posts the Artist has in the order they were added. It is a list that holds every post at most once.
     """
+    __slots__ = ('id', 'community_user_id', 'name', 'list_name', 'is_online', 'profile_nick_name',
+                 'profile_img_path', 'is_birthday', 'group_name', 'max_comment_count', 'community_id', 'is_enabled',
+                 'has_new_to_fans', 'has_new_private_to_fans', 'to_fan_last_id', 'to_fan_last_created_at',
+                 'to_fan_last_expire_in', 'birthday_img_url', 'community', 'posts', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('artist_id')
         self.community_user_id = kwargs.get('community_user_id')
@@ -132,7 +139,7 @@ class Artist:
         self.to_fan_last_expire_in = kwargs.get('to_fan_last_expire_in')
         self.birthday_img_url = kwargs.get('birthday_img_url')
         self.community: Optional[Community] = None
-        self.posts = []
+        self.posts = PostCollection()
 
     def __eq__(self, other):
         """Check if the IDs of the Artists are equal."""
@@ -0,0 +1,133 @@
+from typing import Dict, Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Weverse.models import Post
+
+
+class PostCollection(list):
+    r"""A list of posts that holds every post at most once.
+
+    It is a :class:`list`, so indexing, slicing, comparing, and the other list operations work as before.
+    Posts are identified by their ID through an index next to the list, so adding a post that is already in the
+    collection replaces it in place instead of adding it again, and `in` does not scan the list.
+
+    .. container:: operations
+
+        .. describe:: x in y
+
+            Checks if a post with the same ID is in the collection.
+
+    Parameters
+    ----------
+    posts: Iterable[:ref:`Post`]
+        The posts to start the collection with.
+    """
+    __slots__ = ('_posts',)
+
+    def __init__(self, posts: Iterable['Post'] = ()):
+        super().__init__()
+        self._posts: Optional[Dict[int, 'Post']] = {}
+        self.extend(posts)
+
+    def append(self, post: 'Post'):
+        """Add a post to the end of the collection or replace the post with the same ID."""
+        posts = self._index()
+        existing = posts.get(post.id)
+        posts[post.id] = post
+        if existing is None:
+            super().append(post)
+        elif existing is not post:
+            super().__setitem__(self._position(existing), post)
+
+    def extend(self, posts: Iterable['Post']):
+        """Add several posts to the collection."""
+        for post in posts:
+            self.append(post)
+
+    def __iadd__(self, posts: Iterable['Post']):
+        self.extend(posts)
+        return self
+
+    def insert(self, index: int, post: 'Post'):
+        """Insert a post at a position, or replace the post with the same ID where it is."""
+        posts = self._index()
+        if post.id in posts:
+            self.append(post)
+        else:
+            posts[post.id] = post
+            super().insert(index, post)
+
+    def discard(self, post: 'Post'):
+        """Remove a post from the collection if it is in it."""
+        if post.id in self._index():
+            self.remove(post)
+
+    def get(self, post_id: int) -> Optional['Post']:
+        """Get a post of the collection by its ID.
+
+        :param post_id: The ID of the post.
+        :returns: Optional[:ref:`Post`]
+        """
+        return self._index().get(post_id)
+
+    def remove(self, post: 'Post'):
+        super().remove(post)
+        self._index().pop(post.id, None)
+
+    def pop(self, index: int = -1) -> 'Post':
+        post = super().pop(index)
+        self._index().pop(post.id, None)
+        return post
+
+    def clear(self):
+        super().clear()
+        self._posts = {}
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def __imul__(self, value: int):
+        # repeating the posts would add them more than once, so only clearing is done.
+        if value <= 0:
+            self.clear()
+        return self
+
+    def __contains__(self, post):
+        """Check if a post with the same ID is in the collection."""
+        return getattr(post, 'id', None) in self._index()
+
+    def __reduce__(self):
+        # the posts may not have their attributes yet while a snapshot is unpickled,
+        # so the ID index is only built once the collection is used.
+        return type(self), (), list(self)
+
+    def __setstate__(self, posts):
+        super().extend(posts)
+        self._posts = None
+
+    def _index(self) -> Dict[int, 'Post']:
+        """Get the ID index, building it if the collection was unpickled."""
+        if self._posts is None:
+            self._reindex()
+        return self._posts
+
+    def _position(self, post: 'Post') -> int:
+        """Get the position of a post that is in the collection."""
+        for index, other in enumerate(self):
+            if other is post:
+                return index
+        raise ValueError(f"Post {post.id} is not in the collection.")
+
+    def _reindex(self):
+        """Rebuild the ID index after the list was changed directly, keeping the first post of each ID."""
+        posts = {}
+        for post in self:
+            posts.setdefault(post.id, post)
+        if len(posts) != len(self):
+            super().__init__(posts.values())
+        self._posts = posts
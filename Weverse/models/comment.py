@@ -70,6 +70,9 @@ class Comment:
     post: Post
         The Post Object the comment belongs to.
     """
+    __slots__ = ('id', 'body', 'comment_count', 'like_count', 'has_my_like', 'is_blind', 'post_id', 'created_at',
+                 'updated_at', 'post', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('comment_id')
         self.body = kwargs.get('body')
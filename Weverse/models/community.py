@@ -1,4 +1,4 @@
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from Weverse.models import Artist, Tab
@@ -76,6 +76,10 @@ class Community:
     tabs: List[Tab]
         The Tabs the community has.
     """
+    __slots__ = ('id', 'name', 'description', 'member_count', 'home_banner', 'icon', 'banner', 'full_name',
+                 'fc_member', 'show_member_count', 'artists', 'tabs', '_artist_index', '_indexed_artists',
+                 '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('community_id')
         self.name = kwargs.get('name')
@@ -89,6 +93,22 @@ class Community:
         self.show_member_count = kwargs.get('show_member_count')
         self.artists: List[Artist] = []
         self.tabs: List[Tab] = []
+        self._artist_index: dict = {}
+        self._indexed_artists: tuple = (None, 0)
+
+    def get_artist_by_community_user_id(self, community_user_id) -> Optional['Artist']:
+        """Get an artist of the community by their community user ID.
+
+        The artists are indexed by their community user ID, and the index is rebuilt
+        when :attr:`artists` is replaced or changes in size.
+
+        :param community_user_id: The community user ID of the artist.
+        :returns: Optional[:ref:`Artist`]
+        """
+        if self._indexed_artists[0] is not self.artists or self._indexed_artists[1] != len(self.artists):
+            self._artist_index = {artist.community_user_id: artist for artist in self.artists}
+            self._indexed_artists = (self.artists, len(self.artists))
+        return self._artist_index.get(community_user_id)
 
     def __eq__(self, other):
         """Check if the IDs of the Communities are equal."""
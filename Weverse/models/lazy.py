@@ -0,0 +1,44 @@
+from typing import Dict
+
+
+class LazyModel:
+    r"""A mixin for models that are created from the raw response of the Weverse API and only decode a field
+    the first time it is accessed.
+
+    The decoded value is stored on the object, so every field is decoded at most once.
+    A field is either read directly from the raw response through :attr:`_raw_keys`
+    or built by a ``_load_<field>`` method on the model.
+
+    Lazy models keep the raw response alive for as long as they exist, which trades memory for the time
+    that is saved when most fields are never read.
+    """
+    __slots__ = ()
+
+    # attribute name -> key in the raw response
+    _raw_keys: Dict[str, str] = {}
+
+    def __getattr__(self, name):
+        """Decode a field that has not been accessed yet and remember it."""
+        raw_key = self._raw_keys.get(name)
+        if raw_key is not None:
+            value = self._raw.get(raw_key)
+        else:
+            loader = getattr(type(self), f"_load_{name}", None)
+            if loader is None:
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            value = loader(self)
+
+        setattr(self, name, value)
+        return value
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a field was already decoded, without decoding it.
+
+        :param name: The name of the field.
+        :returns: bool
+        """
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
@@ -68,6 +68,9 @@ class Media:
     videos: List[:ref:`Video`]
         A list of videos under the media post.
     """
+    __slots__ = ('id', 'community_id', 'body', 'type', 'thumbnail_path', 'title', 'level', 'video_link',
+                 'youtube_id', 'photos', 'videos', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('id')
         self.community_id = kwargs.get('communityId')
@@ -79,6 +79,10 @@ class Notification:
     platform: str
         The platform of the notification.
     """
+    __slots__ = ('id', 'message', 'bold_element', 'community_id', 'community_name', 'contents_type', 'contents_id',
+                 'notified_at', 'icon_image_url', 'thumbnail_image_url', 'artist_id', 'is_membership_content',
+                 'is_web_only', 'platform', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('notification_id')
         self.message = kwargs.get('message')
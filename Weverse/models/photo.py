@@ -72,6 +72,10 @@ class Photo:
     post: Post
         The Post Object the photo belongs to.
     """
+    __slots__ = ('id', 'media_id', 'content_index', 'thumbnail_img_url', 'thumbnail_img_width',
+                 'thumbnail_img_height', 'original_img_url', 'original_img_width', 'original_img_height',
+                 'file_name', 'post', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('photo_id')
         self.media_id = kwargs.get('media_id')
@@ -1,6 +1,7 @@
 from typing import Optional, List
 
 from . import Video, Photo, Artist, Comment
+from .lazy import LazyModel
 
 
 class Post:
@@ -49,9 +50,9 @@ class Post:
         If the client user has the post liked.
     has_my_bookmark: bool
         If the client user has the post bookmarked.
-    created_at:
+    created_at: :class:`datetime.datetime`
         When the post was created
-    updated_at:
+    updated_at: :class:`datetime.datetime`
         When the post was last modified.
     is_locked: bool
         Whether the post is locked.
@@ -75,6 +76,8 @@ class Post:
         The Community Artist ID that made the post.
     artist_id: int
         The ID of the Artist that made the post.
+    community_id: int
+        The ID of the Community the post belongs to.
 
     Attributes
     -----------
@@ -96,9 +99,9 @@ class Post:
         If the client user has the post liked.
     has_my_bookmark: bool
         If the client user has the post bookmarked.
-    created_at:
+    created_at: :class:`datetime.datetime`
         When the post was created
-    updated_at:
+    updated_at: :class:`datetime.datetime`
         When the post was last modified.
     is_locked: bool
         Whether the post is locked.
@@ -122,9 +125,16 @@ class Post:
         The Community Artist ID that made the post.
     artist_id: int
         The ID of the Artist that made the post.
+    community_id: int
+        The ID of the Community the post belongs to.
     artist: Artist
         The Artist Object the post belongs to.
     """
+    __slots__ = ('id', 'community_tab_id', 'type', 'body', 'comment_count', 'like_count', 'max_comment_count',
+                 'has_my_like', 'has_my_bookmark', 'created_at', 'updated_at', 'is_locked', 'is_blind', 'is_active',
+                 'is_private', 'photos', 'videos', 'is_hot_trending_post', 'is_limit_comment', 'artist_comments',
+                 'community_artist_id', 'artist_id', 'community_id', 'artist', '__weakref__')
+
     def __init__(self, **kwargs):
         self.id = kwargs.get('post_id')
         self.community_tab_id = kwargs.get('community_tab_id')
@@ -148,6 +158,7 @@ class Post:
         self.artist_comments: Optional[List[Comment]] = kwargs.get('artist_comments')
         self.community_artist_id = kwargs.get('community_artist_id')
         self.artist_id = kwargs.get('artist_id')
+        self.community_id = kwargs.get('community_id')
         self.artist: Optional[Artist] = None
 
     def __eq__(self, other):
@@ -168,3 +179,94 @@ class Post:
     def __len__(self):
         """Returns the amount of images (not videos) available."""
         return len(self.photos) or len(self.videos) or len(self.body)
+
+
+class LazyPost(LazyModel, Post):
+    r"""A :class:`Post` that is created directly from the raw response of the Weverse API.
+
+    Only the ID is read when the object is created.
+    Every other attribute is decoded from the raw response the first time it is accessed
+    (See :class:`Weverse.models.lazy.LazyModel`).
+
+    It is not suggested to create a LazyPost manually, but rather through the
+    following method: :class:`Weverse.objects.create_post_objects` with `lazy` set to True.
+
+    Parameters
+    ----------
+    raw: dict
+        The post information received from the endpoint.
+    community_id: int
+        The ID of the community the post belongs to.
+    """
+    __slots__ = ('_raw',)
+
+    _raw_keys = {
+        'community_tab_id': 'communityTabId',
+        'type': 'type',
+        'body': 'body',
+        'comment_count': 'commentCount',
+        'like_count': 'likeCount',
+        'max_comment_count': 'maxCommentCount',
+        'has_my_like': 'hasMyLike',
+        'has_my_bookmark': 'hasMyBookmark',
+        'is_locked': 'isLocked',
+        'is_blind': 'isBlind',
+        'is_active': 'isActive',
+        'is_private': 'isPrivate',
+        'is_hot_trending_post': 'isHotTrendingPost',
+        'is_limit_comment': 'isLimitComment'
+    }
+
+    # noinspection PyMissingConstructor
+    def __init__(self, raw: dict, community_id: int = None):
+        self._raw = raw
+        self.community_id = community_id
+        self.id = raw.get('id')
+        self.artist: Optional[Artist] = None
+
+    def _load_community_artist_id(self):
+        return (self._raw.get('communityUser') or {}).get('id')
+
+    def _load_artist_id(self):
+        return (self._raw.get('communityUser') or {}).get('artistId')
+
+    def _load_created_at(self):
+        from ..objects import parse_timestamp
+        return parse_timestamp(self._raw.get('createdAt'))
+
+    def _load_updated_at(self):
+        from ..objects import parse_timestamp
+        return parse_timestamp(self._raw.get('updatedAt'))
+
+    def _load_photos(self):
+        from ..objects import create_photo_objects
+        return self._adopt(create_photo_objects(self._raw.get('photos')))
+
+    def _load_videos(self):
+        from ..objects import create_video_objects
+        return self._adopt(create_video_objects(self._raw.get('attachedVideos'), self.community_id))
+
+    def _load_artist_comments(self):
+        from ..objects import create_comment_objects
+        return self._adopt(create_comment_objects(self._raw.get('artistComments')))
+
+    def _raw_created_at(self):
+        """When the post was created, without decoding the other fields. Not stored on the post."""
+        if self.is_loaded('created_at'):
+            return self.created_at
+        from ..objects import parse_timestamp
+        return parse_timestamp(self._raw.get('createdAt'))
+
+    def _raw_photo_ids(self) -> list:
+        """The IDs of the photos of the post, without decoding them."""
+        return [photo.get('id') for photo in self._raw.get('photos') or []]
+
+    def _raw_video_urls(self) -> list:
+        """The URLs of the videos of the post, without decoding them."""
+        return [video.get('videoUrl') for video in self._raw.get('attachedVideos') or []]
+
+    def _adopt(self, children: list) -> list:
+        """Set this post as the post of its photos, videos, or comments."""
+        for child in children:
+            child.post = self
+        return children
@@ -35,6 +35,8 @@ class Tab:
         The Tab name.
 
     """
+    __slots__ = ('id', 'name', '__weakref__')
+
     def __init__(self, tab_id=None, name=None):
         self.id = tab_id
         self.name = name
@@ -61,6 +61,9 @@ class Video:
     post: Optional[Post]
         The Post Object the video belongs to.
     """
+    __slots__ = ('video_url', 'thumbnail_url', 'thumbnail_width', 'thumbnail_height', 'length', 'post',
+                 'community_id', '__weakref__')
+
     def __init__(self, **kwargs):
         self.video_url = kwargs.get('video_url')
         self.thumbnail_url = kwargs.get('thumbnail_url')
@@ -126,6 +129,9 @@ class VideoStream(Video):
     m3u8_urls: str
         Several urls for the resolution m3u8 files.
     """
+    __slots__ = ('hls_path', 'dash_path', 'content_index', 'video_id', 'encoding_status', 'type', 'video_width',
+                 'video_height', 'is_vertical', 'caption_s3_paths', 'level', 'base_url', 'm3u8_urls')
+
     def __init__(self, **kwargs):
         super(VideoStream, self).__init__(**kwargs)
         self.hls_path = kwargs.get('hls_path')
@@ -1,7 +1,42 @@
+import re
+from datetime import datetime, timezone
 from typing import List, Dict
 
 from .models import Community, Artist, Tab, Notification, Post, Photo, Comment, Media, Video, Announcement, \
-    VideoStream
+    VideoStream, LazyPost
+
+
+_UTC_OFFSET_WITHOUT_COLON = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+def parse_timestamp(value):
+    """Parses a timestamp received from an endpoint into a timezone aware datetime.
+
+    :param value: An ISO 8601 string, an epoch timestamp in seconds or milliseconds, or a datetime.
+        Timestamps and datetimes without a timezone are treated as UTC.
+    :returns: Optional[:class:`datetime.datetime`] The value itself if it could not be parsed.
+    """
+    if value is None:
+        return value
+
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+    if isinstance(value, (int, float)):
+        # epoch timestamps from the endpoints are in milliseconds.
+        return datetime.fromtimestamp(value / 1000 if value > 10 ** 11 else value, tz=timezone.utc)
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        # older versions of python only parse the format that datetime.isoformat creates.
+        try:
+            parsed = datetime.fromisoformat(_UTC_OFFSET_WITHOUT_COLON.sub(r"\1:\2", value.replace("Z", "+00:00")))
+        except ValueError:
+            return value
+    except TypeError:
+        return value
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
 def create_community_objects(current_communities: list, already_existing: Dict[int, Community] = None) -> dict:
@@ -119,17 +154,30 @@ def create_notification_objects(current_notifications: list) -> list:
     return user_notifications
 
 
-def create_post_objects(current_posts: list, community: Community, new=False) -> list:
+def create_post_objects(current_posts: list, community: Community, new=False, add_to_artist=True,
+                        lazy=False) -> list:
     """Creates post objects based on a list of posts sent in and the community and returns the objects.
 
     :param current_posts: Post information received from endpoint.
     :param community: :ref:`Community` that the post belongs in.
     :param new: :class:`bool` Whether or not the post is new.
+    :param add_to_artist: :class:`bool` Whether the post should be added to the posts of its :ref:`Artist`.
+    :param lazy: :class:`bool` Whether to create :class:`Weverse.models.LazyPost` objects that only decode
+        their information when it is accessed.
     :returns: List[:ref:`Post`]
     """
     posts = []
     if current_posts:
         for post in current_posts:
+            if lazy:
+                post_obj = LazyPost(post, community.id)
+                if new:
+                    posts.insert(0, post_obj)
+                else:
+                    posts.append(post_obj)
+                _add_post_to_artist(post_obj, community, post_obj.community_artist_id, add_to_artist)
+                continue
+
             artist_comments = create_comment_objects(post.get('artistComments'))
             artist_photos = create_photo_objects(post.get('photos'))
             artist_videos = create_video_objects(post.get('attachedVideos'), community.id)
@@ -147,8 +195,8 @@ def create_post_objects(current_posts: list, community: Community, new=False) ->
                 'max_comment_count': post.get('maxCommentCount'),
                 'has_my_like': post.get('hasMyLike'),
                 'has_my_bookmark': post.get('hasMyBookmark'),
-                'created_at': post.get('createdAt'),
-                'updated_at': post.get('updatedAt'),
+                'created_at': parse_timestamp(post.get('createdAt')),
+                'updated_at': parse_timestamp(post.get('updatedAt')),
                 'is_locked': post.get('isLocked'),
                 'is_blind': post.get('isBlind'),
                 'is_active': post.get('isActive'),
@@ -157,7 +205,8 @@ def create_post_objects(current_posts: list, community: Community, new=False) ->
                 'videos': artist_videos,
                 'is_hot_trending_post': post.get('isHotTrendingPost'),
                 'is_limit_comment': post.get('isLimitComment'),
-                'artist_comments': artist_comments
+                'artist_comments': artist_comments,
+                'community_id': community.id
             }
             post_obj = Post(**kwargs)
             if new:
@@ -170,13 +219,25 @@ def create_post_objects(current_posts: list, community: Community, new=False) ->
                 photo.post = post_obj
             for video in artist_videos:
                 video.post = post_obj
-            for artist in community.artists:
-                if artist.community_user_id == community_artist_id:
-                    artist.posts.append(post_obj)
-                    post_obj.artist = artist
+            _add_post_to_artist(post_obj, community, community_artist_id, add_to_artist)
     return posts
 
 
+def _add_post_to_artist(post: Post, community: Community, community_artist_id, add_to_artist=True):
+    """Link a post to the :ref:`Artist` of the community that made it.
+
+    :param post: :ref:`Post` to link.
+    :param community: :ref:`Community` that the post belongs in.
+    :param community_artist_id: The Community Artist ID that made the post.
+    :param add_to_artist: :class:`bool` Whether the post should be added to the posts of the :ref:`Artist`.
+    """
+    artist = community.get_artist_by_community_user_id(community_artist_id)
+    if artist:
+        if add_to_artist:
+            artist.posts.append(post)
+        post.artist = artist
+
+
 def create_video_objects(current_videos: list, community_id=None) -> list:
     """Creates & Returns video objects based on a list of videos.
 
@@ -0,0 +1,221 @@
+import asyncio
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket:
+    r"""A token bucket that allows a steady rate of requests with short bursts.
+
+    Parameters
+    ----------
+    rate: float
+        The amount of tokens added per second. None for no limit.
+    capacity: float
+        The most tokens the bucket holds, which is the largest burst. At least 1.
+        Defaults to the rate, or 1 if the rate is below 1.
+    """
+    def __init__(self, rate: Optional[float], capacity: Optional[float] = None):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive.")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+
+        self.rate = rate
+        # a bucket that can not hold a whole token would never give one out.
+        self.capacity = max(1, capacity or rate or 1)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def tokens(self) -> float:
+        """The amount of tokens that are available now."""
+        if self.rate is None:
+            return float("inf")
+
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def delay(self) -> float:
+        """How many seconds to wait until a token is available.
+
+        :returns: 0 if a token is available now.
+        """
+        now = time.monotonic()
+        wait = max(0.0, self._blocked_until - now)
+        if self.rate is not None:
+            self._refill(now)
+            if self._tokens < 1:
+                wait = max(wait, (1 - self._tokens) / self.rate)
+        return wait
+
+    def take(self):
+        """Take a token. Should only be called when `delay` is 0."""
+        if self.rate is not None:
+            self._tokens -= 1
+
+    def block(self, seconds: float):
+        """Do not give out tokens for a while.
+
+        :param seconds: The amount of seconds to block.
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    r"""
+    Limits the requests of a client with a client-wide token bucket and optional buckets per endpoint family.
+
+    A request waits until a token is available in the client-wide bucket and in the bucket of its family.
+    When Weverse responds with 429 Too Many Requests, every request waits for the `Retry-After` of the response.
+
+    Parameters
+    ----------
+    rate: float
+        The amount of requests per second of the whole client. None for no limit. Defaults to None.
+    burst: float
+        The most requests that may be made at once after a quiet period. At least 1.
+        Defaults to the rate, or 1 if the rate is below 1.
+    family_limits: Dict[str, Tuple[float, float]]
+        The (rate, burst) of endpoint families. EX: {"notifications": (1, 2), "posts": (5, 10)}
+        See `families` for the names.
+    max_retries: int
+        How many times a request that was rate-limited is retried. Defaults to 3.
+    default_retry_after: float
+        The seconds to wait after a 429 response without a usable `Retry-After`. Defaults to 5.
+
+    Attributes
+    -----------
+    families: Tuple[Tuple[str, str]]
+        The name and url regex of each endpoint family, checked in order.
+    throttled: int
+        The amount of times a request had to wait for a token.
+    rate_limited: int
+        The amount of 429 responses.
+    retries: int
+        The amount of requests that were retried after a 429 response.
+    """
+    families = (
+        ("login", r"/oauth/"),
+        ("notifications", r"/notifications/"),
+        ("comments", r"/comments/"),
+        ("media", r"/medias/|mediaTab|/videos/"),
+        ("announcements", r"/notices/"),
+        ("posts", r"/posts/"),
+        ("communities", r"/communities/"),
+        ("users", r"/users/"),
+    )
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 family_limits: Dict[str, Tuple[float, float]] = None, max_retries: int = 3,
+                 default_retry_after: float = 5):
+        self.bucket = TokenBucket(rate, burst)
+        self.family_buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(family_rate, family_burst)
+            for family, (family_rate, family_burst) in (family_limits or {}).items()
+        }
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+
+        self.throttled = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self._family_regexes = [(name, re.compile(pattern)) for name, pattern in self.families]
+
+    def family(self, url: str) -> Optional[str]:
+        """Get the endpoint family of a url.
+
+        :param url: The url.
+        :returns: The name of the family, or None if the url is not in a family.
+        """
+        for name, regex in self._family_regexes:
+            if regex.search(url):
+                return name
+
+    def _reserve(self, url: str) -> float:
+        """Take a token from every bucket of a url if all of them have one, otherwise get how long to wait."""
+        buckets = [self.bucket]
+        family_bucket = self.family_buckets.get(self.family(url)) if self.family_buckets else None
+        if family_bucket:
+            buckets.append(family_bucket)
+
+        wait = max(bucket.delay() for bucket in buckets)
+        if not wait:
+            for bucket in buckets:
+                bucket.take()
+        return wait
+
+    async def acquire(self, url: str):
+        """Wait until a request to a url may be made.
+
+        This is a coroutine and must be awaited.
+
+        :param url: The url that will be requested.
+        """
+        wait = self._reserve(url)
+        if wait:
+            self.throttled += 1
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self._reserve(url)
+
+    def acquire_sync(self, url: str):
+        """Block until a request to a url may be made.
+
+        :param url: The url that will be requested.
+        """
+        wait = self._reserve(url)
+        if wait:
+            self.throttled += 1
+        while wait:
+            time.sleep(wait)
+            wait = self._reserve(url)
+
+    def retry_after(self, value: Optional[str]) -> float:
+        """Get the seconds to wait from a `Retry-After` header.
+
+        :param value: The header, either seconds or an HTTP date.
+        :returns: The seconds to wait, or `default_retry_after` if the header could not be used.
+        """
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+        return self.default_retry_after
+
+    def record_rate_limited(self, retry_after: Optional[str]) -> float:
+        """Make every request wait after a 429 response.
+
+        :param retry_after: The `Retry-After` header of the response.
+        :returns: The seconds that requests will wait.
+        """
+        self.rate_limited += 1
+        seconds = self.retry_after(retry_after)
+        self.bucket.block(seconds)
+        return seconds
+
+    def stats(self) -> dict:
+        """
+        Get the token levels and throttle counters.
+
+        :returns: dict with the available tokens of the client-wide bucket and of each family bucket,
+            and the counters.
+        """
+        return {
+            "tokens": self.bucket.tokens,
+            "family_tokens": {family: bucket.tokens for family, bucket in self.family_buckets.items()},
+            "throttled": self.throttled,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries
+        }
@@ -0,0 +1,113 @@
+import asyncio
+import random
+from typing import Iterable, Tuple, Type
+
+import aiohttp
+import requests
+
+
+class RetryPolicy:
+    r"""Decides which failed requests are retried and how long to wait before each retry.
+
+    A request is retried when it raised a connection error or timed out, or when Weverse responded with
+    one of the retried status codes. Only idempotent methods are retried unless `retry_non_idempotent` is set,
+    since a request that failed halfway may already have changed something.
+
+    The wait before retry `n` is a random amount of seconds between 0 and `base_delay * multiplier ** (n - 1)`,
+    capped at `max_delay`, so that clients that failed together do not retry together.
+
+    Parameters
+    ----------
+    max_attempts: int
+        The most times a request is made, including the first. Defaults to 3.
+    base_delay: float
+        The longest wait in seconds before the first retry. Defaults to 0.5.
+    multiplier: float
+        How much the longest wait grows with every retry. Defaults to 2.
+    max_delay: float
+        The longest wait in seconds before any retry. Defaults to 10.
+    retry_statuses: Iterable[int]
+        The status codes that are retried. Defaults to 500, 502, 503, and 504.
+    retry_non_idempotent: bool
+        Whether POST and PATCH requests are retried as well. Defaults to False.
+
+    Attributes
+    -----------
+    idempotent_methods: Tuple[str]
+        The HTTP methods that may be repeated without changing the outcome.
+    retry_exceptions: Tuple[Type[Exception]]
+        The exceptions that are retried.
+    """
+    idempotent_methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    retry_exceptions: Tuple[Type[Exception], ...] = (
+        aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError,
+        requests.ConnectionError, requests.Timeout, ConnectionError
+    )
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, multiplier: float = 2,
+                 max_delay: float = 10, retry_statuses: Iterable[int] = (500, 502, 503, 504),
+                 retry_non_idempotent: bool = False):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def __repr__(self):
+        return f"<RetryPolicy max_attempts={self.max_attempts} base_delay={self.base_delay} " \
+               f"max_delay={self.max_delay}>"
+
+    def copy(self, **overrides) -> 'RetryPolicy':
+        """Create a policy with some of the settings changed.
+
+        EX: `client.retry_policy.copy(max_attempts=1)` for a request that should fail fast.
+
+        :param overrides: The parameters to change.
+        :returns: :class:`Weverse.RetryPolicy`
+        """
+        settings = {
+            "max_attempts": self.max_attempts,
+            "base_delay": self.base_delay,
+            "multiplier": self.multiplier,
+            "max_delay": self.max_delay,
+            "retry_statuses": self.retry_statuses,
+            "retry_non_idempotent": self.retry_non_idempotent
+        }
+        settings.update(overrides)
+        return RetryPolicy(**settings)
+
+    def _may_retry(self, method: str, attempt: int) -> bool:
+        return attempt < self.max_attempts and \
+            (self.retry_non_idempotent or method.upper() in self.idempotent_methods)
+
+    def should_retry_status(self, method: str, status: int, attempt: int) -> bool:
+        """Whether a request that received a status code should be made again.
+
+        :param method: The HTTP method of the request.
+        :param status: The status code of the response.
+        :param attempt: The attempt that received the response, starting from 1.
+        :returns: bool
+        """
+        return status in self.retry_statuses and self._may_retry(method, attempt)
+
+    def should_retry_exception(self, method: str, exception: BaseException, attempt: int) -> bool:
+        """Whether a request that raised an exception should be made again.
+
+        :param method: The HTTP method of the request.
+        :param exception: The exception that was raised.
+        :param attempt: The attempt that raised the exception, starting from 1.
+        :returns: bool
+        """
+        return isinstance(exception, self.retry_exceptions) and self._may_retry(method, attempt)
+
+    def delay(self, attempt: int) -> float:
+        """Get the seconds to wait after a failed attempt.
+
+        :param attempt: The attempt that failed, starting from 1.
+        :returns: float
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1)))
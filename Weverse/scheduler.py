@@ -0,0 +1,60 @@
+import random
+
+
+class PollScheduler:
+    r"""
+    Decides how long the hook loop of a client waits before it checks for new notifications again.
+
+    The wait drops to `min_interval` as soon as new notifications arrive and grows by `backoff` after every
+    check that found nothing, up to `max_interval`. Each wait is randomly spread by `jitter` so that several
+    clients do not poll at the same moment.
+
+    Parameters
+    ----------
+    min_interval: float
+        The shortest wait in seconds. Defaults to 10.
+    max_interval: float
+        The longest wait in seconds. Defaults to 120.
+    backoff: float
+        What the wait is multiplied by after a check without new notifications. Defaults to 1.5.
+    jitter: float
+        The fraction of the wait that is randomly added or removed. Defaults to 0.1.
+
+    Attributes
+    -----------
+    interval: float
+        The current wait in seconds before jitter.
+    """
+    def __init__(self, min_interval: float = 10, max_interval: float = 120, backoff: float = 1.5,
+                 jitter: float = 0.1):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be above 0 and may not be above max_interval.")
+        if backoff < 1:
+            raise ValueError("backoff may not be below 1.")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be from 0 up to 1.")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.interval = min_interval
+
+    def record(self, had_new: bool):
+        """
+        Adjust the wait to the result of a check.
+
+        :param had_new: Whether the check found new notifications.
+        """
+        if had_new:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    def next_delay(self) -> float:
+        """
+        Get the amount of seconds to wait before the next check.
+
+        :returns: float
+        """
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
@@ -0,0 +1,308 @@
+import asyncio
+import hashlib
+from bisect import bisect
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from .error import InvalidToken, InvalidCredentials, LoginFailed
+from .events import EventStream, NotificationEvent, StreamConsumer
+
+
+class HashRing:
+    r"""A consistent hash ring that assigns keys to nodes.
+
+    Every node is placed on the ring several times, so the keys are spread evenly, and adding or removing a node
+    only moves the keys of that node.
+
+    Parameters
+    ----------
+    nodes: Iterable[Hashable]
+        The nodes to start with.
+    replicas: int
+        How many times each node is placed on the ring. Defaults to 100.
+    """
+    def __init__(self, nodes: Iterable[Hashable] = (), replicas: int = 100):
+        if replicas < 1:
+            raise ValueError("replicas must be at least 1.")
+
+        self.replicas = replicas
+        self._hashes: List[int] = []
+        self._nodes_by_hash: Dict[int, Hashable] = {}
+        self._nodes: Set[Hashable] = set()
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(value) -> int:
+        return int.from_bytes(hashlib.md5(str(value).encode()).digest()[:8], "big")
+
+    @property
+    def nodes(self) -> Set[Hashable]:
+        """The nodes on the ring."""
+        return set(self._nodes)
+
+    def add(self, node: Hashable):
+        """Place a node on the ring.
+
+        :param node: The node.
+        """
+        if node in self._nodes:
+            return
+
+        self._nodes.add(node)
+        for replica in range(self.replicas):
+            node_hash = self._hash(f"{node}-{replica}")
+            self._nodes_by_hash[node_hash] = node
+        self._hashes = sorted(self._nodes_by_hash)
+
+    def remove(self, node: Hashable):
+        """Take a node off the ring.
+
+        :param node: The node.
+        """
+        if node not in self._nodes:
+            return
+
+        self._nodes.discard(node)
+        self._nodes_by_hash = {node_hash: owner for node_hash, owner in self._nodes_by_hash.items() if owner != node}
+        self._hashes = sorted(self._nodes_by_hash)
+
+    def get(self, key, accept: Callable[[Hashable], bool] = None) -> Optional[Hashable]:
+        """Get the node of a key.
+
+        :param key: The key.
+        :param accept: A method that is called with the nodes in ring order starting from the node of the key,
+            and returns whether the key may be assigned to it. Defaults to accepting the first node.
+        :returns: The node, or None if no node was accepted.
+        """
+        if not self._hashes:
+            return
+
+        start = bisect(self._hashes, self._hash(key))
+        tried = set()
+        for index in range(start, start + len(self._hashes)):
+            node = self._nodes_by_hash[self._hashes[index % len(self._hashes)]]
+            if node in tried:
+                continue
+            if not accept or accept(node):
+                return node
+            tried.add(node)
+            if len(tried) == len(self._nodes):
+                return
+
+
+class ShardCoordinator:
+    r"""
+    Spreads the communities over several :ref:`WeverseClientAsync` accounts and merges their notifications.
+
+    Every community is assigned to one of the accounts that follow it with a :class:`Weverse.HashRing`.
+    The `community_filter` of each client is set to its communities, so each account only polls for and
+    fetches the contents of its own share. The notification events of every account are merged into
+    one stream, and a notification that several accounts received is only reported once.
+
+    When the token of an account stops working and can not be refreshed, or its notification loop stops,
+    the account is stopped and its communities are assigned to the other accounts. The other assignments
+    do not change. New notifications of a moved community that the new account received while the
+    community belonged to another account are reported by the new account.
+
+    EX: `async for event in coordinator.stream():`
+
+    Parameters
+    ----------
+    clients: Iterable[:ref:`WeverseClientAsync`]
+        A client for each account. The clients should not have a hook, because their `start` would not return.
+    replicas: int
+        How many times each account is placed on the hash ring. Defaults to 100.
+    buffer_size: int
+        The amount of most recent merged events that are kept for consumers. Defaults to 1000.
+    max_seen_events: int
+        The amount of events that are remembered to recognize duplicates. Defaults to 10000.
+    health_check_interval: float
+        How often in seconds the tokens of the accounts are checked. Defaults to 60.
+    verbose: bool
+        Whether to print out when an account fails or communities are moved.
+
+    Attributes
+    -----------
+    clients: List[:ref:`WeverseClientAsync`]
+        The client of each account.
+    ring: :class:`Weverse.HashRing`
+        The hash ring of the indexes of the accounts that are still working.
+    assignments: Dict[int, int]
+        The index of the account that each community ID is assigned to.
+    failed_clients: List[:ref:`WeverseClientAsync`]
+        The clients that were stopped because their token failed or their notification loop stopped.
+    events: :class:`Weverse.events.EventStream`
+        The merged events.
+    duplicates: int
+        The amount of events that were dropped because another account already reported them.
+    """
+    def __init__(self, clients: Iterable, replicas: int = 100, buffer_size: int = 1000,
+                 max_seen_events: int = 10000, health_check_interval: float = 60, verbose: bool = False):
+        self.clients = list(clients)
+        if not self.clients:
+            raise ValueError("At least one client is needed.")
+
+        self.ring = HashRing(range(len(self.clients)), replicas)
+        self.assignments: Dict[int, int] = {}
+        self.failed_clients = []
+        self.events = EventStream(buffer_size)
+        self.duplicates = 0
+        self.verbose = verbose
+
+        self._max_seen_events = max_seen_events
+        self._seen_events: "OrderedDict[tuple, None]" = OrderedDict()
+        self._health_check_interval = health_check_interval
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+    async def start(self, create_old_posts=False, create_media=False, **kwargs):
+        """Start every client and merge their notifications until the coordinator is stopped.
+
+        The posts and media are loaded once the communities are assigned, so every account only loads its share.
+        An account that fails to start is treated the same as an account whose token failed.
+
+        This is a coroutine and must be awaited.
+
+        :param create_old_posts: Whether to create cache for old posts.
+        :param create_media: Whether to create cache for old media.
+        :param kwargs: Passed to :ref:`start` of every client, such as `follow_new_communities`.
+        """
+        results = await asyncio.gather(*[client.start(**kwargs) for client in self.clients], return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if self.verbose:
+                    print(f"Weverse account {index} failed to start - {result!r}")
+                self._remove_account(index)
+
+        if not self.ring.nodes:
+            raise InvalidToken
+
+        self.rebalance()
+        if create_old_posts or create_media:
+            await asyncio.gather(*[self.clients[index].load_communities(create_old_posts=create_old_posts,
+                                                                        create_media=create_media)
+                                   for index in self.ring.nodes])
+
+        self.events.open()
+        self._running = True
+        for index in self.ring.nodes:
+            self._tasks.append(asyncio.ensure_future(self._merge(index, self.clients[index].stream())))
+        self._tasks.append(asyncio.ensure_future(self._check_health()))
+
+    def stream(self, from_start: bool = False) -> StreamConsumer:
+        """Iterate asynchronously over the merged notification events of every account.
+
+        :param from_start: Whether to start from the oldest event that is still buffered
+            instead of the next new notification.
+        :returns: An asynchronous iterator of :class:`Weverse.events.NotificationEvent`
+        """
+        return self.events.subscribe(from_start)
+
+    async def stop(self):
+        """Stop every client and end the merged stream.
+
+        This is a coroutine and must be awaited.
+        """
+        self._running = False
+        for client in self.clients:
+            client.stop()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.events.close()
+
+    def rebalance(self) -> Dict[int, int]:
+        """Assign every followed community to a working account that follows it and update the client filters.
+
+        :returns: Dict[int, int] The community IDs that moved and the index of their new account.
+        """
+        community_ids = set()
+        for index in self.ring.nodes:
+            community_ids.update(self.clients[index].all_communities)
+
+        assignments = {}
+        for community_id in community_ids:
+            index = self.ring.get(community_id, lambda node: community_id in self.clients[node].all_communities)
+            if index is not None:
+                assignments[community_id] = index
+
+        moved = {community_id: index for community_id, index in assignments.items()
+                 if self.assignments.get(community_id) != index}
+        self.assignments = assignments
+
+        for index, client in enumerate(self.clients):
+            client.community_filter = {community_id for community_id, owner in assignments.items() if owner == index}
+
+        if moved and self.verbose:
+            print(f"Assigned {len(moved)} Weverse communities to a new account.")
+        return moved
+
+    def _remove_account(self, index: int):
+        """Take an account off the ring and stop its client."""
+        client = self.clients[index]
+        self.ring.remove(index)
+        if client not in self.failed_clients:
+            self.failed_clients.append(client)
+        client.community_filter = set()
+        client.stop()
+
+    async def _fail_account(self, index: int, reason: str):
+        """Move the communities of an account that stopped working to the other accounts."""
+        if index not in self.ring.nodes:
+            return
+
+        if self.verbose:
+            print(f"Weverse account {index} {reason}. Moving its communities to the other accounts.")
+        self._remove_account(index)
+        self.rebalance()
+
+    async def _check_health(self):
+        """Check the tokens of the accounts that reported an expired token."""
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            for index in list(self.ring.nodes):
+                client = self.clients[index]
+                if not client._expired_token:
+                    continue
+                try:
+                    if client._refresh_token_exists:
+                        await client._refresh_token()
+                    if await client.check_token_works():
+                        continue
+                except (InvalidToken, InvalidCredentials, LoginFailed, asyncio.TimeoutError):
+                    pass
+                await self._fail_account(index, "has a token that failed")
+
+    async def _merge(self, index: int, consumer: StreamConsumer):
+        """Publish the events of one account to the merged stream unless another account already did."""
+        async for event in consumer:
+            if self.assignments.get(event.notification.community_id) != index:
+                continue  # reported late by the previous owner of a moved community.
+
+            key = self._event_key(index, event)
+            if key in self._seen_events:
+                self.duplicates += 1
+                continue
+
+            self._seen_events[key] = None
+            if len(self._seen_events) > self._max_seen_events:
+                self._seen_events.popitem(last=False)
+            self.events.publish(NotificationEvent(event.notification, event.notification_type, event.contents))
+
+        # the stream of a client only ends when its notification loop stopped.
+        if self._running:
+            await self._fail_account(index, "stopped checking for notifications")
+
+    @staticmethod
+    def _event_key(index: int, event: NotificationEvent) -> tuple:
+        """The key of the notification an event is about, which is the same for every account.
+
+        The contents ID alone is not enough, since every comment notification of a post has the ID of the post.
+        """
+        notification = event.notification
+        if notification.contents_id is None or notification.notified_at is None:
+            return index, notification.id
+        return notification.community_id, event.notification_type, notification.contents_id, \
+            notification.notified_at, notification.message
@@ -2,16 +2,24 @@ import asyncio
 import concurrent.futures
 import functools
 import os
-from typing import Optional, List, Union
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, List, Union, Dict, Iterable, Callable
 from os import system as terminal
+from urllib.parse import urlparse
 import aiohttp
 import aiofiles
 from asyncio import get_event_loop
 from .models import Community, Post as w_Post, Notification, Announcement, Media, VideoStream
 from . import WeverseClient, create_post_objects, create_community_objects, create_notification_objects, \
     create_comment_objects, create_media_object, iterate_community_media_categories, create_announcement_object, \
-    InvalidCredentials, LoginFailed, InvalidToken, NoHookFound, check_expired_token, create_video_objects
+    InvalidCredentials, LoginFailed, InvalidToken, NoHookFound, BeingRateLimited, check_expired_token, \
+    create_video_objects, ClientNotStarted
 from json import dumps as dumps_
+from .bus import ContentEvent
+from .dispatcher import HookDispatcher
+from .retry import RetryPolicy
+from .events import EventStream, NotificationEvent, StreamConsumer
 
 
 VERBOSE = False
@@ -24,6 +32,18 @@ class WeverseClientAsync(WeverseClient):
     ----------
     loop:
         Asyncio Event Loop
+    hook_workers: int
+        The amount of worker tasks that call the hook. Defaults to 1.
+    hook_queue_size: int
+        The maximum amount of notification batches waiting for the hook. Defaults to 100.
+    hook_backpressure: str
+        What happens to new notifications while the hook queue is full. "block", "drop_oldest", or "coalesce".
+        See :class:`Weverse.HookDispatcher`. Defaults to "block".
+    event_bus_workers: int
+        The amount of worker tasks that call the handlers of the `event_bus`. Defaults to 1.
+        Their queue uses `hook_queue_size` and `hook_backpressure` as well.
+    stream_buffer_size: int
+        The amount of most recent notification events kept for `stream()` consumers. Defaults to 1000.
     kwargs:
         Same as :ref:`WeverseClient`.
 
@@ -32,13 +52,19 @@ class WeverseClientAsync(WeverseClient):
     -----------
     loop:
         Asyncio Event Loop
+    hook_dispatcher: :class:`Weverse.HookDispatcher`
+        Runs the hook while the hook loop keeps polling. Its metrics are available with `stats()`.
+    event_dispatcher: :class:`Weverse.HookDispatcher`
+        Calls the handlers of the `event_bus` with batches of events while the hook loop keeps polling.
+    events: :class:`Weverse.events.EventStream`
+        The buffer of the most recent notification events that `stream()` reads from.
 
     Attributes are the same as :ref:`WeverseClient`.
     """
 
     def __init__(self, loop=get_event_loop(), **kwargs):
         self._follow_new_communities = True
-        self._time_passed: int = 0
+        self._follow_interval = 14400  # 4 hours in seconds
         self._request_payload_for_follow = {
             "profileNickname": "NONE",
             "profileImgPath": "https://cdn-contents.weverse.io/static/profile/profile_defalut_img_05.png"
@@ -46,14 +72,28 @@ class WeverseClientAsync(WeverseClient):
         self.loop = loop
         self._cookies: Optional[dict] = None
         self.__cookies_test_url = "https://weversewebapi.weverse.io/wapi/v1/communities/2/videos/4093"
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
         super().__init__(**kwargs)
+        self.events = EventStream(kwargs.get("stream_buffer_size") or 1000)
+        self._poll_task: Optional[asyncio.Future] = None
+        self._loop_running = False  # from when a hook loop is started until it closed the stream.
+        self._restart_loop = False  # whether a stopping hook loop should start again for new consumers.
+        self.hook_dispatcher = HookDispatcher(self._hook, workers=kwargs.get("hook_workers") or 1,
+                                              max_queue_size=kwargs.get("hook_queue_size") or 100,
+                                              policy=kwargs.get("hook_backpressure") or "block",
+                                              verbose=self.verbose)
+        self.event_dispatcher = HookDispatcher(self._publish_bus_events,
+                                               workers=kwargs.get("event_bus_workers") or 1,
+                                               max_queue_size=kwargs.get("hook_queue_size") or 100,
+                                               policy=kwargs.get("hook_backpressure") or "block",
+                                               verbose=self.verbose)
 
         if self.verbose:
             global VERBOSE
             VERBOSE = self.verbose
 
     async def start(self, create_old_posts=False, create_notifications=True, create_media=False,
-                    follow_new_communities=True):
+                    follow_new_communities=True, on_community_loaded: Callable = None):
         """Creates internal cache.
 
         This is the main process that should be run.
@@ -65,6 +105,9 @@ class WeverseClientAsync(WeverseClient):
         :parameter create_media: (:class:`bool`) Whether to create/update cache for old media.
         :param follow_new_communities: bool
             Check for new communities and automatically follow them.
+        :param on_community_loaded: Callable
+            A method that will be called with each :ref:`Community` as soon as its posts and media are loaded.
+            May be a coroutine function.
 
         :raises: :class:`Weverse.error.InvalidToken`
             If the token was invalid.
@@ -79,7 +122,8 @@ class WeverseClientAsync(WeverseClient):
         """
         try:
             if not self.web_session:
-                self.web_session = aiohttp.ClientSession()
+                self.web_session = self._create_web_session()
+                await self.warm_up()
 
             if not self._login_info_exists and not self._token_exists:
                 raise InvalidCredentials
@@ -91,6 +135,9 @@ class WeverseClientAsync(WeverseClient):
             if not await self.check_token_works():
                 raise InvalidToken
 
+            # start from the cache of a previous run if one exists.
+            snapshot_loaded = bool(self._snapshot_path) and self.load_snapshot(self._snapshot_path)
+
             # create all communities that are subscribed to
             await self.create_communities()  # communities should be created no matter what
 
@@ -105,17 +152,17 @@ class WeverseClientAsync(WeverseClient):
             if create_notifications:
                 await self.get_user_notifications()
 
-            for community in self.all_communities.values():
-                # load up posts
-                if create_old_posts:
-                    await self.create_posts(community)
-
-                # load up media
-                if create_media:
-                    await self.create_media(community)
+            # load up posts and media
+            if create_old_posts or create_media:
+                # posts restored from a snapshot only need the ones that were created since.
+                await self.load_communities(create_old_posts=create_old_posts, create_media=create_media,
+                                            on_community_loaded=on_community_loaded, incremental=snapshot_loaded)
 
             self.cache_loaded = True
 
+            if self._snapshot_path:
+                self.save_snapshot(self._snapshot_path)
+
             if self._hook:
                 if self.verbose:
                     print("Starting Notification Loop for Weverse Client.")
@@ -123,32 +170,272 @@ class WeverseClientAsync(WeverseClient):
         except Exception as err:
             raise err
 
+    def _create_web_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session with the connection settings of the client."""
+        connector = aiohttp.TCPConnector(limit=self._connection_limit, limit_per_host=self._connection_limit_per_host,
+                                         keepalive_timeout=self._keepalive_timeout,
+                                         ttl_dns_cache=self._dns_cache_ttl)
+        total = self._request_timeout if self._request_timeout is not None else aiohttp.client.DEFAULT_TIMEOUT.total
+        timeout = aiohttp.ClientTimeout(total=total, connect=self._connect_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def warm_up(self):
+        """Open connections to the Weverse hosts ahead of time so that they can be reused by the first requests.
+
+        A failed connection is not an error, since the request that needs it will connect again.
+
+        This is a coroutine and must be awaited.
+        """
+        async def open_connection(url):
+            try:
+                async with self.web_session.request("HEAD", url):
+                    pass
+            except Exception as e:
+                if self.verbose:
+                    print(f"Could not open a connection to {url} ahead of time - {e!r}")
+
+        await asyncio.gather(*[open_connection(url) for url in self._warm_up_urls
+                               for _ in range(min(self._warm_up_connections, self._connection_limit_per_host))])
+
     async def _start_loop_for_hook(self):
         """
         Start checking for new notifications in a new loop and call the hook with the list of new Notifications
         This will also create the posts associated with the notification so they can be used efficiently.
         This is a coroutine and must be awaited.
         """
-        if not self._hook:
+        if not self._hook and not self._poll_task:
             raise NoHookFound
 
-        self._hook_loop = True
-        while self._hook_loop:
-            if self._follow_new_communities:
-                if self._time_passed == 14400:  # 4 hours in seconds
-                    self._time_passed = 0
-                    await self.follow_all_communities()
-
-                self._time_passed += 30
-            await asyncio.sleep(30)
-            new_notifications = await self.update_cache_from_notification()
-            if not new_notifications:
+        if not self._loop_running:
+            # a loop started by stream() was already marked as running, and may have been stopped since.
+            self._loop_running = True
+            self._hook_loop = True
+        self.hook_dispatcher.start()
+        self.event_dispatcher.start()
+        self.events.open()
+        last_follow = last_full_check = time.monotonic()
+        try:
+            while self._hook_loop:
+                await asyncio.sleep(self._poll_scheduler.next_delay())
+                if self._follow_new_communities and time.monotonic() - last_follow >= self._follow_interval:
+                    last_follow = time.monotonic()
+                    try:
+                        await self.follow_all_communities()
+                    except Exception as e:
+                        if self.verbose:
+                            print(f"Failed to follow new Weverse communities - {e!r}")
+
+                # the has-new endpoint is cheap but not always accurate, so a full check still happens every so often.
+                try:
+                    has_new = await self._has_new_notifications()
+                except Exception as e:
+                    has_new = None  # unknown, so the notifications are fully fetched.
+                    if self.verbose:
+                        print(f"Failed to check for new Weverse notifications - {e!r}")
+
+                new_notifications = []
+                if has_new is not False or time.monotonic() - last_full_check >= self._poll_scheduler.max_interval:
+                    last_full_check = time.monotonic()
+                    new_notifications = await self.update_cache_from_notification()
+
+                self._poll_scheduler.record(bool(new_notifications))
+                if new_notifications and self._hook:
+                    await self.hook_dispatcher.dispatch(new_notifications)
+        finally:
+            await self.hook_dispatcher.stop()
+            await self.event_dispatcher.stop()
+            if self._restart_loop:
+                # a consumer subscribed while the loop was stopping, so the stream stays open for it.
+                self._restart_loop = False
+                self._hook_loop = True
+                self._poll_task = asyncio.ensure_future(self._start_loop_for_hook())
+            else:
+                self.events.close()
+                self._poll_task = None
+                self._loop_running = False
+
+    def stop(self):
+        """Stop the hook loop and write any pending cache changes to the cache backend."""
+        self._restart_loop = False
+        super().stop()
+
+    def stream(self, from_start: bool = False) -> StreamConsumer:
+        """Iterate asynchronously over new notifications together with the object they are about.
+
+        EX: `async for event in client.stream():`
+
+        Every call creates an independent consumer with its own cursor, so several consumers may read the same
+        notifications at their own pace. The notifications are checked by the hook loop, which is started
+        if it is not running yet, or started again once it stopped if it is stopping.
+        The iteration ends when the client is stopped.
+
+        :param from_start: Whether to start from the oldest event that is still buffered
+            instead of the next new notification.
+        :returns: An asynchronous iterator of :class:`Weverse.events.NotificationEvent`
+        :raises: :class:`Weverse.error.ClientNotStarted`
+            If the client was not started and no web session was passed in.
+        """
+        if not self.web_session:
+            raise ClientNotStarted
+
+        consumer = self.events.subscribe(from_start)
+        if not self._loop_running:
+            self._loop_running = True
+            self._hook_loop = True
+            self.events.open()  # before the consumer is iterated, so it does not see the previous close.
+            self._poll_task = asyncio.ensure_future(self._start_loop_for_hook())
+        elif not self._hook_loop:
+            self._restart_loop = True
+        return consumer
+
+    async def load_communities(self, communities: Iterable[Community] = None, create_old_posts=True,
+                               create_media=False, on_community_loaded: Callable = None, incremental=False):
+        """Load the posts and media of several communities concurrently.
+
+        This is a coroutine and must be awaited.
+
+        :param communities: Iterable[:ref:`Community`]
+            The communities to load. Defaults to all communities in cache.
+        :param create_old_posts: bool
+            Whether to create cache for old posts.
+        :param create_media: bool
+            Whether to create cache for old media.
+        :param on_community_loaded: Callable
+            A method that will be called with each :ref:`Community` as soon as it is loaded.
+            May be a coroutine function.
+        :param incremental: bool
+            Whether to only load posts that are not known yet. See :ref:`create_posts`.
+        """
+        async for community in self.iter_load_communities(communities, create_old_posts, create_media, incremental):
+            if not on_community_loaded:
                 continue
 
-            if not asyncio.iscoroutinefunction(self._hook):
-                self._hook(new_notifications)
+            if not asyncio.iscoroutinefunction(on_community_loaded):
+                on_community_loaded(community)
             else:
-                await self._hook(new_notifications)
+                await on_community_loaded(community)
+
+    async def iter_load_communities(self, communities: Iterable[Community] = None, create_old_posts=True,
+                                    create_media=False, incremental=False):
+        """Load the posts and media of several communities concurrently and yield each community once it is loaded.
+
+        At most `max_concurrent_communities` communities are loaded at once.
+        A community that failed to load is not yielded.
+
+        :param communities: Iterable[:ref:`Community`]
+            The communities to load. Defaults to all communities in cache.
+        :param create_old_posts: bool
+            Whether to create cache for old posts.
+        :param create_media: bool
+            Whether to create cache for old media.
+        :param incremental: bool
+            Whether to only load posts that are not known yet. See :ref:`create_posts`.
+        :returns: An asynchronous iterator of :ref:`Community` in the order they finished loading.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_communities)
+        communities = list(communities) if communities is not None else \
+            [community for community in self.all_communities.values() if self.handles_community(community.id)]
+        tasks = [asyncio.ensure_future(self.__load_community(community, semaphore, create_old_posts, create_media,
+                                                             incremental))
+                 for community in communities]
+        try:
+            for task in asyncio.as_completed(tasks):
+                community = await task
+                if community:
+                    yield community
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def __load_community(self, community: Community, semaphore: asyncio.Semaphore, create_old_posts: bool,
+                               create_media: bool, incremental: bool) -> Optional[Community]:
+        """Load the posts and media of a community while holding a semaphore.
+
+        This is a coroutine and must be awaited.
+
+        :returns: The :ref:`Community` if it was loaded, otherwise None.
+        """
+        async with semaphore:
+            try:
+                if create_old_posts:
+                    await self.create_posts(community, incremental=incremental)
+
+                if create_media:
+                    await self.create_media(community)
+                return community
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to load the posts and media of community {community.id} - {e}")
+
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, retry_policy: RetryPolicy = None, **kwargs):
+        """Make a request to Weverse while respecting the rate limiter and the per-host request budget.
+
+        A request that Weverse rate-limited is retried after its `Retry-After`, and a request that failed
+        for a transient reason is retried as the retry policy allows.
+        Should be used as an asynchronous context manager that gives the response.
+
+        :param method: The HTTP method to use.
+        :param url: The url to request.
+        :param retry_policy: The :class:`Weverse.RetryPolicy` to use instead of the client's.
+        :param kwargs: Keyword arguments to pass into the web session's request.
+        :raises: :class:`Weverse.error.BeingRateLimited`
+            If the request was still rate-limited after the retries.
+        """
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if not semaphore:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self._max_requests_per_host)
+
+        retry_policy = retry_policy or self.retry_policy
+        attempt = rate_limited = 0
+        while True:
+            await self.rate_limiter.acquire(url)
+            attempt += 1
+            responded = False
+            try:
+                async with semaphore:
+                    async with self.web_session.request(method, url, **kwargs) as resp:
+                        if resp.status == 429:
+                            rate_limited += 1
+                            attempt -= 1  # rate-limited requests have their own budget.
+                            retry_after = self.rate_limiter.record_rate_limited(resp.headers.get("Retry-After"))
+                            if rate_limited > self.rate_limiter.max_retries:
+                                raise BeingRateLimited
+                            self.rate_limiter.retries += 1
+                            if self.verbose:
+                                print(f"WARNING: Weverse rate-limited {url}. Retrying in {retry_after} seconds.")
+                            continue
+
+                        if not retry_policy.should_retry_status(method, resp.status, attempt):
+                            responded = True
+                            yield resp
+                            return
+
+                        if self.verbose:
+                            print(f"WARNING: {url} responded with {resp.status}. Retrying.")
+            except Exception as e:
+                if responded or not retry_policy.should_retry_exception(method, e, attempt):
+                    raise
+                if self.verbose:
+                    print(f"WARNING: Request to {url} failed - {e!r}. Retrying.")
+            await asyncio.sleep(retry_policy.delay(attempt))
+
+    async def _read_json(self, resp):
+        """Decode the JSON body of a response with the client's JSON decoder.
+
+        Bodies larger than the executor threshold are decoded in the default executor
+        so that the event loop is not blocked while they are decoded.
+
+        This is a coroutine and must be awaited.
+
+        :param resp: The response to decode.
+        """
+        body = await resp.read()
+        if len(body) >= self._json_executor_threshold:
+            return await asyncio.get_running_loop().run_in_executor(None, self._decode_json, body)
+        return self._decode_json(body)
 
     async def _try_login(self):
         """
@@ -166,9 +453,9 @@ class WeverseClientAsync(WeverseClient):
         login_payload: dict
             The client's login payload
         """
-        async with self.web_session.post(url=self._login_url, json=login_payload) as resp:
+        async with self._request("POST", url=self._login_url, json=login_payload) as resp:
             if self.check_status(resp.status, self._login_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 refresh_token = data.get("refresh_token")
                 token = data.get("access_token")
                 if refresh_token:
@@ -186,9 +473,9 @@ class WeverseClientAsync(WeverseClient):
         This is a coroutine and must be awaited.
 
         """
-        async with self.web_session.post(url=self._login_url, json=self._refresh_payload) as resp:
+        async with self._request("POST", url=self._login_url, json=self._refresh_payload) as resp:
             if self.check_status(resp.status, self._login_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 token = data.get("access_token")
                 if token:
                     self._set_token(token)
@@ -201,22 +488,46 @@ class WeverseClientAsync(WeverseClient):
     async def create_media(self, community: Community):
         """Paginate through a community's media and add it to object cache.
 
+        Photo media that already exist in cache are not fetched again.
+
         :parameter community: :ref:`Community` the posts exist under.
         """
         media_tab_url = f"{self._api_stream_url}{community.id}/{self._api_media_tab}"
-        async with self.web_session.get(media_tab_url, headers=self._headers) as resp:
-            if self.check_status(resp.status, media_tab_url):
-                data = await resp.json()
-                media_objects, photo_media_dicts = iterate_community_media_categories(data)
+        async with self._request("GET", media_tab_url, headers=self._headers) as resp:
+            if not self.check_status(resp.status, media_tab_url):
+                return
+            data = await self._read_json(resp)
 
-                # This endpoint does NOT give us any information about the photos, therefore we must make
-                # a separate api call to retrieve proper photo information for the photo media.
-                for media in photo_media_dicts:
-                    media_obj = await self.fetch_media(community.id, media.get("id"))
-                    if media_obj:
-                        media_objects.append(media_obj)
+        media_objects, photo_media_dicts = iterate_community_media_categories(data)
 
-                self._add_media_to_cache(media_objects)
+        # This endpoint does NOT give us any information about the photos, therefore we must make
+        # a separate api call to retrieve proper photo information for the photo media.
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        photo_media_ids = dict.fromkeys(media.get("id") for media in photo_media_dicts)
+        fetched_media = await asyncio.gather(*[self.__fetch_media_with_limit(community.id, media_id, semaphore)
+                                               for media_id in photo_media_ids if media_id not in self.all_media])
+        media_objects.extend(media_obj for media_obj in fetched_media if media_obj)
+
+        self._add_media_to_cache(media_objects)
+
+    async def __fetch_media_with_limit(self, community_id, media_id, semaphore: asyncio.Semaphore) -> Optional[Media]:
+        """Receive a media object while holding a semaphore.
+
+        A failed request will return None instead of raising so that the other media are still loaded.
+
+        This is a coroutine and must be awaited.
+
+        :param community_id: The ID of the community the media belongs to.
+        :param media_id: The ID of the media to fetch.
+        :param semaphore: Semaphore limiting the amount of in-flight requests.
+        :returns: :ref:`Media` or NoneType
+        """
+        async with semaphore:
+            try:
+                return await self.fetch_media(community_id, media_id)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to fetch media {media_id} from community {community_id} - {e}")
 
     @check_expired_token
     async def create_communities(self):
@@ -224,9 +535,9 @@ class WeverseClientAsync(WeverseClient):
 
         This is a coroutine and must be awaited.
         """
-        async with self.web_session.get(self._api_communities_url, headers=self._headers) as resp:
+        async with self._request("GET", self._api_communities_url, headers=self._headers) as resp:
             if self.check_status(resp.status, self._api_communities_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 user_communities = data.get("communities")
                 self.all_communities = create_community_objects(user_communities, self.all_communities)
 
@@ -237,65 +548,156 @@ class WeverseClientAsync(WeverseClient):
         :param specific_community_ids: List[int]
             Will only do this list of community ids from the already existing communities.
 
+        The communities are fetched concurrently with at most `max_concurrent_requests` requests in-flight.
+        A failure in one community will not stop the other communities from loading.
+
         This is a coroutine and must be awaited.
         """
-        for community in self.all_communities.values():
-            if specific_community_ids:
-                if community.id not in specific_community_ids:
-                    continue
-            url = self._api_communities_url + str(community.id)
-            async with self.web_session.get(url, headers=self._headers) as resp:
-                if self.check_status(resp.status, url):
-                    data = await resp.json()
-                    self.process_community_artists_and_tabs(community, data)
-                    for artist in community.artists:
-                        self.all_artists[artist.id] = artist
-                    for tab in community.tabs:
-                        self.all_tabs[tab.id] = tab
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        communities = [community for community in self.all_communities.values()
+                       if (not specific_community_ids or community.id in specific_community_ids)
+                       and self.handles_community(community.id)]
+        await asyncio.gather(*[self.__create_community_artists_and_tabs(community, semaphore)
+                               for community in communities])
 
-    @check_expired_token
-    async def create_posts(self, community: Community, next_page_id: int = None):
+    async def __create_community_artists_and_tabs(self, community: Community, semaphore: asyncio.Semaphore):
+        """Create the artists and tabs of a single community and record how long it took.
+
+        This is a coroutine and must be awaited.
+
+        :param community: :ref:`Community` to load the artists and tabs of.
+        :param semaphore: Semaphore limiting the amount of in-flight requests.
+        """
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                url = self._api_communities_url + str(community.id)
+                async with self._request("GET", url, headers=self._headers) as resp:
+                    if self.check_status(resp.status, url):
+                        data = await self._read_json(resp)
+                        self.process_community_artists_and_tabs(community, data)
+                        self._add_community_artists_and_tabs(community)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to load the artists and tabs of community {community.id} - {e}")
+            finally:
+                self.community_load_times[community.id] = time.perf_counter() - start_time
+
+    async def create_posts(self, community: Community, next_page_id: int = None, incremental=False):
         """Paginate through a community's posts and add it to object cache.
 
         This is a coroutine and must be awaited.
 
         :parameter community: :ref:`Community` the posts exist under.
         :parameter [OPTIONAL] next_page_id: Next Page ID (Weverse paginates posts).
+        :parameter [OPTIONAL] incremental: Only add posts that are not known yet and stop paginating as soon as
+            a page only contains known posts.
+        """
+        def has_no_known_posts(data: dict) -> bool:
+            # a page with known posts is usually followed by a page that only has known posts.
+            return not any(self._is_known_post(community.id, post.get('id')) for post in data.get('posts') or [])
+
+        newest_post_id = None
+        async for data in self._iter_post_page_data(community, next_page_id,
+                                                    should_prefetch=has_no_known_posts if incremental else None):
+            page_posts = data.get('posts') or []
+            if incremental:
+                page_posts = [post for post in page_posts if not self._is_known_post(community.id, post.get('id'))]
+
+            posts = create_post_objects(page_posts, community,
+                                        add_to_artist=self._cache_backend.keeps_objects_in_memory,
+                                        lazy=self._lazy_models)
+            self._add_posts_to_cache(posts)
+            newest_post_id = max([post.id for post in posts if post.id] + [newest_post_id or 0]) or None
+
+            if data.get('isEnded') or (incremental and not page_posts):
+                # every post of the community was seen, so the newest one may become the watermark.
+                if not next_page_id:
+                    self._update_post_watermark(community.id, newest_post_id)
+                break
+
+    async def iter_post_pages(self, community: Community, next_page_id: int = None):
+        """Asynchronously iterate through a community's posts one page at a time.
+
+        The posts are NOT added to the object cache, which allows the history of a community to be streamed
+        without holding all of it in memory.
+        The next page is requested while the current page is being consumed.
+
+        :parameter community: :ref:`Community` the posts exist under.
+        :parameter [OPTIONAL] next_page_id: Page ID to start from (Weverse paginates posts).
+        :returns: An asynchronous iterator of List[:ref:`Post`]
+        """
+        async for data in self._iter_post_page_data(community, next_page_id):
+            yield create_post_objects(data.get('posts'), community, add_to_artist=False, lazy=self._lazy_models)
+
+    async def _iter_post_page_data(self, community: Community, next_page_id: int = None,
+                                   should_prefetch: Callable[[dict], bool] = None):
+        """Asynchronously iterate through the raw pages of a community's posts.
+
+        The request for the next page is sent before the current page is yielded, unless `should_prefetch`
+        returns False for the current page. The next page is then only requested once the current page was
+        consumed and the iteration goes on.
+
+        :parameter community: :ref:`Community` the posts exist under.
+        :parameter [OPTIONAL] next_page_id: Page ID to start from.
+        :parameter [OPTIONAL] should_prefetch: Called with each page and returns whether to prefetch the next page.
+            Defaults to always prefetching.
+        :returns: An asynchronous iterator of dict
+        """
+        next_page = asyncio.ensure_future(self._fetch_post_page(community, next_page_id))
+        try:
+            while next_page:
+                data = await next_page
+                next_page = None
+                if not data:
+                    return
+
+                last_id = None if data.get('isEnded') else data.get('lastId')
+                if last_id and (should_prefetch is None or should_prefetch(data)):
+                    next_page = asyncio.ensure_future(self._fetch_post_page(community, last_id))
+                    await asyncio.sleep(0)  # let the prefetch send its request before the page is processed.
+                yield data
+
+                if last_id and not next_page:
+                    next_page = asyncio.ensure_future(self._fetch_post_page(community, last_id))
+        finally:
+            if next_page and not next_page.done():
+                next_page.cancel()
+
+    @check_expired_token
+    async def _fetch_post_page(self, community: Community, next_page_id: int = None) -> Optional[dict]:
+        """Fetch a single page of a community's posts.
+
+        This is a coroutine and must be awaited.
+
+        :parameter community: :ref:`Community` the posts exist under.
+        :parameter [OPTIONAL] next_page_id: Next Page ID (Weverse paginates posts).
+        :returns: Optional[dict]
         """
         artist_tab_url = self._api_communities_url + str(community.id) + '/' + self._api_all_artist_posts_url
         if next_page_id:
             artist_tab_url = artist_tab_url + "?from=" + str(next_page_id)
-        async with self.web_session.get(artist_tab_url, headers=self._headers) as resp:
+        async with self._request("GET", artist_tab_url, headers=self._headers) as resp:
             if self.check_status(resp.status, artist_tab_url):
-                data = await resp.json()
-                posts = create_post_objects(data.get('posts'), community)
-                for post in posts:
-                    self.all_posts[post.id] = post
-                    if post.photos:
-                        for photo in post.photos:
-                            self.all_photos[photo.id] = photo
-
-                    if post.videos:
-                        for video in post.photos:
-                            self.all_videos[video.video_url] = video
-
-                if not data.get('isEnded'):
-                    await self.create_posts(community, data.get('lastId'))
+                return await self._read_json(resp)
 
     @check_expired_token
-    async def create_post(self, community: Community, post_id) -> w_Post:
+    async def create_post(self, community: Community, post_id, retry_policy: RetryPolicy = None) -> w_Post:
         """Create a post and update the cache with it. This is meant for an individual post.
 
         This is a coroutine and must be awaited.
 
         :parameter community: :ref:`Community` the post was created under.
         :parameter post_id: The id of the post we are needing to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         """
         post_url = self._api_communities_url + str(community.id) + '/posts/' + str(post_id)
-        async with self.web_session.get(post_url, headers=self._headers) as resp:
+        async with self._request("GET", post_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status, post_url):
-                data = await resp.json()
-                return (create_post_objects([data], community, new=True))[0]
+                data = await self._read_json(resp)
+                return (create_post_objects([data], community, new=True,
+                                            add_to_artist=self._cache_backend.keeps_objects_in_memory,
+                                            lazy=self._lazy_models))[0]
 
     @check_expired_token
     async def get_user_notifications(self):
@@ -305,16 +707,28 @@ class WeverseClientAsync(WeverseClient):
 
         :returns: List[:ref:`Notification`]
         """
-        self._old_notifications = self.user_notifications  # important for keeping track of what is new.
-
-        async with self.web_session.get(self._api_notifications_url, headers=self._headers) as resp:
+        async with self._request("GET", self._api_notifications_url, headers=self._headers) as resp:
             if self.check_status(resp.status, self._api_notifications_url):
-                data = await resp.json()
-                self.user_notifications = create_notification_objects(data.get('notifications'))
-                for user_notification in self.user_notifications:
-                    self.all_notifications[user_notification.id] = user_notification
+                data = await self._read_json(resp)
+                self._process_user_notifications(create_notification_objects(data.get('notifications')))
                 return self.user_notifications
 
+    @check_expired_token
+    async def _has_new_notifications(self) -> Optional[bool]:
+        """Ask Weverse whether there is a new user notification without fetching the notifications.
+
+        This is a coroutine and must be awaited.
+
+        :returns: Optional[:class:`bool`] None if it could not be determined.
+        """
+        # the next poll is a better retry than waiting here.
+        async with self._request("GET", self._api_new_notifications_url, headers=self._headers,
+                                 retry_policy=self._poll_retry_policy) as resp:
+            if not self.check_status(resp.status, self._api_new_notifications_url):
+                return
+            data = await self._read_json(resp)
+        return data.get('has_new')
+
     @check_expired_token
     async def check_new_user_notifications(self) -> bool:
         """Checks if there is a new user notification, updates the cache, and returns if there was.
@@ -327,18 +741,15 @@ class WeverseClientAsync(WeverseClient):
         This endpoint has been acting a bit off and not producing accurate results. It would be recommended to
         instantly get new notifications with :ref:`update_cache_from_notification` instead.
         """
-        async with self.web_session.get(self._api_new_notifications_url, headers=self._headers) as resp:
-            if self.check_status(resp.status, self._api_new_notifications_url):
-                data = await resp.json()
-                has_new = data.get('has_new')
-                if has_new:
-                    # update cache
-                    # Not that cache_loaded necessarily matters here,
-                    # but just in case other checks are happening concurrently.
-                    self.cache_loaded = False
-                    await self.update_cache_from_notification()
-                    self.cache_loaded = True
-                return has_new
+        has_new = await self._has_new_notifications()
+        if has_new:
+            # update cache
+            # Not that cache_loaded necessarily matters here,
+            # but just in case other checks are happening concurrently.
+            self.cache_loaded = False
+            await self.update_cache_from_notification()
+            self.cache_loaded = True
+        return has_new
 
     @check_expired_token
     async def translate(self, post_or_comment_id, is_post=False, is_comment=False, p_obj=None, community_id=None):
@@ -378,73 +789,78 @@ class WeverseClientAsync(WeverseClient):
                 return None
         url = self._api_communities_url + str(community_id) + "/" + method_url + str(
             post_or_comment_id) + "/translate?languageCode=en"
-        async with self.web_session.get(url, headers=self._headers) as resp:
+        async with self._request("GET", url, headers=self._headers) as resp:
             if self.check_status(resp.status, url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 return data.get('translation')
 
     @check_expired_token
-    async def fetch_artist_comments(self, community_id, post_id):
+    async def fetch_artist_comments(self, community_id, post_id, retry_policy: RetryPolicy = None):
         """Fetches the artist comments on a post.
 
         This is a coroutine and must be awaited.
 
         :parameter community_id: Community ID the post is on.
         :parameter post_id: Post ID to fetch the artist comments of.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: List[:ref:`Comment`]
         """
         post_comments_url = self._api_communities_url + str(community_id) + '/posts/' + str(post_id) + "/comments/"
-        async with self.web_session.get(post_comments_url, headers=self._headers) as resp:
+        async with self._request("GET", post_comments_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status, post_comments_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 return create_comment_objects(data.get('artistComments'))
 
     @check_expired_token
-    async def fetch_comment_body(self, community_id, comment_id) -> str:
+    async def fetch_comment_body(self, community_id, comment_id, retry_policy: RetryPolicy = None) -> str:
         """Fetches a comment from its ID.
 
         This is a coroutine and must be awaited.
 
         :parameter community_id: The ID of the community the comment belongs to.
         :parameter comment_id: The ID of the comment to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: (:class:`str`) Body of the comment.
         """
         comment_url = f"{self._api_communities_url}{str(community_id)}/comments/{comment_id}/"
-        async with self.web_session.get(comment_url, headers=self._headers) as resp:
+        async with self._request("GET", comment_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status, comment_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 return data.get('body')
 
     @check_expired_token
-    async def fetch_media(self, community_id, media_id) -> Optional[Media]:
+    async def fetch_media(self, community_id, media_id, retry_policy: RetryPolicy = None) -> Optional[Media]:
         """Receive media object based on media id.
 
         This is a coroutine and must be awaited.
 
         :parameter community_id: The ID of the community the media belongs to.
         :parameter media_id: The ID of the media to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: :ref:`Media` or NoneType
         """
         media_url = self._api_communities_url + str(community_id) + "/medias/" + str(media_id)
-        async with self.web_session.get(media_url, headers=self._headers) as resp:
+        async with self._request("GET", media_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status, media_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 return create_media_object(data.get('media'))
 
     @check_expired_token
-    async def fetch_announcement(self, community_id: int, announcement_id: int) -> Optional[Announcement]:
+    async def fetch_announcement(self, community_id: int, announcement_id: int,
+                                 retry_policy: RetryPolicy = None) -> Optional[Announcement]:
         """Receive announcement object based on announcement id.
 
         This is a coroutine and must be awaited.
 
         :parameter community_id: The ID of the community the media belongs to.
         :parameter announcement_id: The ID of the announcement to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: :ref:`Announcement` or NoneType
         """
         announcement_url = self._api_communities_url + str(community_id) + "/notices/" + str(announcement_id)
-        async with self.web_session.get(announcement_url, headers=self._headers) as resp:
+        async with self._request("GET", announcement_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status, announcement_url):
-                data = await resp.json()
+                data = await self._read_json(resp)
                 return create_announcement_object(data)
 
     @staticmethod
@@ -471,13 +887,16 @@ class WeverseClientAsync(WeverseClient):
         self._request_payload_for_follow['profileNickname'] = self.__generate_random_nickname()
         _headers = self._headers
         _headers['Content-Type'] = 'application/json'
-        async with self.web_session.put(url, headers=_headers, data=dumps_(self._request_payload_for_follow)) as \
+        async with self._request("PUT", url, headers=_headers, data=dumps_(self._request_payload_for_follow)) as \
                 resp:
-            if resp.status == 400 and attempts < 1:
-                return await self.follow_community(community_id, attempts + 1)
-            if self.check_status(resp.status, url):
-                if self.verbose:
-                    print(f"Followed {community_id}.")
+            status = resp.status
+
+        # retry outside of the request so the per-host budget is not held twice.
+        if status == 400 and attempts < 1:
+            return await self.follow_community(community_id, attempts + 1)
+        if self.check_status(status, url):
+            if self.verbose:
+                print(f"Followed {community_id}.")
 
     @check_expired_token
     async def follow_all_communities(self):
@@ -500,9 +919,9 @@ class WeverseClientAsync(WeverseClient):
             A list of community ids
         """
         url = self._api_url + 'app-properties/key/webCommunityRedirectPath'
-        async with self.web_session.get(url, headers=self._headers) as resp:
+        async with self._request("GET", url, headers=self._headers) as resp:
             if self.check_status(resp.status, url):
-                list_of_communities_: dict = await resp.json()
+                list_of_communities_: dict = await self._read_json(resp)
                 return [community_info['id'] for community_info in list_of_communities_.get('communities')]
         return []
 
@@ -511,6 +930,10 @@ class WeverseClientAsync(WeverseClient):
 
         Will also return the new notifications found.
 
+        The contents of the new notifications are fetched concurrently and added to cache in the order of the
+        notifications. A notification whose contents could not be fetched is still returned.
+        The handlers of the `event_bus` are called by the `event_dispatcher` and may still be running on return.
+
         This is a coroutine and must be awaited.
 
         :returns: List[:class:`models.Notification`]
@@ -523,45 +946,68 @@ class WeverseClientAsync(WeverseClient):
                 return new_notifications
 
             new_notifications = self.get_new_notifications()
-            for notification in new_notifications:
-                await self.__manage_notification_posts(notification)
         except Exception as e:
             if self.verbose:
                 print(f"Failed to update Weverse Cache - {e}")
+            return new_notifications
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        results = await asyncio.gather(*[self.__fetch_notification_contents(notification, semaphore)
+                                         for notification in new_notifications], return_exceptions=True)
+        bus_events = []
+        for notification, result in zip(new_notifications, results):
+            notification_type, contents = None, None
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                notification_type = result[0]
+                contents = self._add_notification_contents_to_cache(*result)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to update Weverse Cache from notification {notification.id} - {e}")
+            self.events.publish(NotificationEvent(notification, notification_type, contents))
+            event = self.event_bus.create_event(notification_type, contents, notification)
+            if event:
+                bus_events.append(event)
+
+        if bus_events:
+            # the handlers run in the workers of the event dispatcher, so a slow handler does not delay polling.
+            await self.event_dispatcher.dispatch(bus_events)
         return new_notifications
 
-    async def __manage_notification_posts(self, notification: Notification):
-        """Manages the creation of Notification posts and comments.
+    async def _publish_bus_events(self, events: List[ContentEvent]):
+        """Call the handlers of the `event_bus` with a batch of events in order.
 
         This is a coroutine and must be awaited.
 
-        :param notification: Notification to create comments and posts for.
+        :param events: List[:class:`Weverse.bus.ContentEvent`]
+        """
+        for event in events:
+            await self.event_bus.publish_async(event)
+
+    async def __fetch_notification_contents(self, notification: Notification, semaphore: asyncio.Semaphore):
+        """Fetch the comment, post, media, or announcement that a notification is about.
+
+        This is a coroutine and must be awaited.
+
+        :param notification: Notification to fetch the contents of.
+        :param semaphore: Semaphore limiting the amount of in-flight requests.
+        :returns: A tuple of the notification type and the contents.
         """
         notification_type = self.determine_notification_type(notification.message)
         community = self.get_community_by_id(notification.community_id)
-        if notification_type == 'comment':
-            artist_comments = await self.fetch_artist_comments(notification.community_id, notification.contents_id)
-            if artist_comments:
-                comment = artist_comments[0]
-                comment.post = self.get_post_by_id(comment.post_id)
-                if comment.post:
-                    if comment.post.artist_comments:
-                        comment.post.artist_comments.insert(0, comment)
-                    else:
-                        comment.post.artist_comments = [comment]
-                self.all_comments[comment.id] = comment
-        elif notification_type in ["tofans", "post"]:
-            post = await self.create_post(community, notification.contents_id)
-            if post:
-                self.all_posts[post.id] = post
-        elif notification_type == 'media':
-            media = await self.fetch_media(community.id, notification.contents_id)
-            if media:
-                self.all_media[media.id] = media
-        elif notification_type == 'announcement':
-            announcement = await self.fetch_announcement(community.id, notification.contents_id)
-            if announcement:
-                self.all_announcements[announcement.id] = announcement
+        async with semaphore:
+            if notification_type == 'comment':
+                contents = await self.fetch_artist_comments(notification.community_id, notification.contents_id)
+            elif notification_type in ["tofans", "post"]:
+                contents = await self.create_post(community, notification.contents_id)
+            elif notification_type == 'media':
+                contents = await self.fetch_media(community.id, notification.contents_id)
+            elif notification_type == 'announcement':
+                contents = await self.fetch_announcement(community.id, notification.contents_id)
+            else:
+                contents = None
+        return notification_type, contents
 
     async def check_token_works(self) -> bool:
         """
@@ -571,7 +1017,7 @@ class WeverseClientAsync(WeverseClient):
 
         :returns: (:class:`bool`) True if the token works.
         """
-        async with self.web_session.get(url=self._user_endpoint, headers=self._headers) as resp:
+        async with self._request("GET", url=self._user_endpoint, headers=self._headers) as resp:
             self._expired_token = not resp.status == 200
             return not self._expired_token
 
@@ -595,9 +1041,9 @@ class WeverseClientAsync(WeverseClient):
 
         if not self._cookies:
             url = video_url_without_drm_type + '?drmType=Widevine'
-            async with self.web_session.get(url=url, headers=self._headers) as resp:
+            async with self._request("GET", url=url, headers=self._headers) as resp:
                 if self.check_status(resp.status, url):
-                    data = await resp.json()
+                    data = await self._read_json(resp)
                     self._cookies = data['signedCookie']
         return self._cookies
 
@@ -622,23 +1068,23 @@ class WeverseClientAsync(WeverseClient):
         cookies = await self.get_cookies(url)
         self._headers['cookie'] = cookies
         for m3u8_url in video_stream_obj.m3u8_urls:
-            async with self.web_session.get(url=m3u8_url,
-                                            headers=self._headers) as resp:
+            async with self._request("GET", url=m3u8_url, headers=self._headers) as resp:
                 if not self.check_status(resp.status, m3u8_url):
                     continue
 
                 data_bytes_string = await resp.read()
-                data_string = data_bytes_string.decode('ascii')
-                lines = data_string.split("\n")
-                ts_file_names = [line for line in lines if line.endswith('.ts')]
-                ts_file_urls = [f"{video_stream_obj.base_url}{ts_file_name}" for ts_file_name in ts_file_names]
-                ts_file_paths = [f"./{ts_file_name}" for ts_file_name in ts_file_names]
-                downloaded_list = await self._download_ts_files(ts_file_urls, ts_file_paths)
-                concat_files_syntax = '|'.join(downloaded_list)
-                ffmpeg_concat_protocol = f'ffmpeg -i "concat:{concat_files_syntax}" -c copy {output_file_path}'
-                await self.run_blocking_code(self._run_in_terminal, ffmpeg_concat_protocol)
-                await self.run_blocking_code(self._remove_files, downloaded_list)
-                break  # we have our output file for highest quality found.
+
+            data_string = data_bytes_string.decode('ascii')
+            lines = data_string.split("\n")
+            ts_file_names = [line for line in lines if line.endswith('.ts')]
+            ts_file_urls = [f"{video_stream_obj.base_url}{ts_file_name}" for ts_file_name in ts_file_names]
+            ts_file_paths = [f"./{ts_file_name}" for ts_file_name in ts_file_names]
+            downloaded_list = await self._download_ts_files(ts_file_urls, ts_file_paths)
+            concat_files_syntax = '|'.join(downloaded_list)
+            ffmpeg_concat_protocol = f'ffmpeg -i "concat:{concat_files_syntax}" -c copy {output_file_path}'
+            await self.run_blocking_code(self._run_in_terminal, ffmpeg_concat_protocol)
+            await self.run_blocking_code(self._remove_files, downloaded_list)
+            break  # we have our output file for highest quality found.
 
     async def _download_ts_files(self, urls, file_paths) -> List[str]:
         """
@@ -657,7 +1103,7 @@ class WeverseClientAsync(WeverseClient):
         """
         downloaded_files = []
         for idx, url in enumerate(urls):
-            async with self.web_session.get(url, headers=self._headers) as resp:
+            async with self._request("GET", url, headers=self._headers) as resp:
                 if self.check_status(resp.status, url):
                     async with aiofiles.open(file_paths[idx], mode='wb') as file:
                         await file.write(await resp.read())
@@ -1,10 +1,22 @@
 import asyncio
-from typing import List, Optional, Union, Dict
-
-from . import create_artist_objects, create_tab_objects, InvalidToken, LoginFailed
+import gc
+import json
+import os
+import pickle
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Union, Dict, Callable, Any, Iterable
+
+from . import create_artist_objects, create_tab_objects, parse_timestamp, InvalidToken, LoginFailed, CacheBackend
+from .cache import TimeIndex, MemoryCacheStore
+from .scheduler import PollScheduler
+from .bus import EventBus
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .models import Artist as w_Artist, \
     Comment as w_Comment, Media as w_Media, Notification as w_Notification, Photo as w_Photo, Post as w_Post, \
-    Tab as w_Tab, Community as w_Community, Video as w_Video, Announcement as w_Announcement
+    Tab as w_Tab, Community as w_Community, Video as w_Video, Announcement as w_Announcement, \
+    LazyPost as w_LazyPost
 
 from base64 import b64decode, b64encode
 from Crypto.PublicKey import RSA
@@ -35,6 +47,93 @@ class WeverseClient:
     hook:
         A passed in method that will be called every time there is a new notification.
         This method must take in a list of :class:`models.Notification` objects.
+    max_concurrent_requests: int
+        The maximum amount of requests that may be in-flight at once when the client fans out
+        over several communities. Defaults to 10.
+    max_concurrent_communities: int
+        The maximum amount of communities that may have their posts and media loaded at once. Defaults to 5.
+    max_requests_per_host: int
+        The maximum amount of requests that may be in-flight to a single host at once. Defaults to 10.
+    connection_limit: int
+        The maximum amount of open connections of the session the asynchronous client creates. Defaults to 100.
+    connection_limit_per_host: int
+        The maximum amount of open connections to a single host. Defaults to `max_requests_per_host`.
+    keepalive_timeout: float
+        The seconds an idle connection is kept open for reuse by the asynchronous client. Defaults to 60.
+    dns_cache_ttl: int
+        The seconds a resolved host name is cached by the asynchronous client. Defaults to 300.
+    request_timeout: float
+        The seconds a request may take before it times out. For the synchronous client, this is the longest wait
+        for data from the server instead. Defaults to None, which keeps the default of the HTTP library:
+        5 minutes for the asynchronous client and no limit for the synchronous client.
+        A lower limit may cut off large media downloads.
+    connect_timeout: float
+        The seconds opening a connection may take before it times out. Defaults to 10.
+    warm_up_connections: int
+        The amount of connections opened to each Weverse host when the client starts, so that the first requests
+        do not wait for the TCP and TLS handshakes. The synchronous client opens at most one since it makes one
+        request at a time. 0 to disable. Defaults to 2.
+    snapshot_path: :class:`str`
+        A file path used to store the internal cache between restarts.
+        If it exists, the cache is loaded from it when the client starts and it is saved once the cache is loaded.
+    cache_backend: :class:`Weverse.cache.CacheBackend`
+        The backend that stores the posts, photos, comments, notifications, media, videos, and announcements.
+        Defaults to keeping them in memory. A :class:`Weverse.cache.SQLiteCacheBackend` may be passed in to keep
+        them in a database instead.
+    cache_limits: Dict[str, dict]
+        The size and age limits of the in-memory caches when no `cache_backend` is passed in.
+        EX: {"posts": {"max_size": 50000}, "notifications": {"ttl": 604800}}
+        See :class:`Weverse.cache.CacheBackend`.
+    lazy_models: bool
+        Whether posts should be created as :class:`Weverse.models.LazyPost` objects that only decode their
+        information from the API response when it is accessed. This makes loading many posts faster
+        but keeps the API responses in memory. Defaults to False.
+    json_decoder:
+        A function that decodes the body of an API response (as bytes) into Python objects.
+        EX: `orjson.loads` or `msgspec.json.Decoder().decode`. Defaults to :func:`json.loads`.
+    max_seen_notifications: int
+        The amount of notification IDs that are remembered to tell which notifications are new. Defaults to 10000.
+    max_held_notification_age: float
+        How many seconds older than the newest notification a held back notification may be before it is dropped.
+        See `community_filter`. Defaults to 3600.
+    max_replayed_notifications: int
+        The most held back notifications that become new in one check for notifications. Defaults to 20.
+    poll_scheduler: :class:`Weverse.PollScheduler`
+        Decides how long the hook loop waits between checks for new notifications.
+        Defaults to a :class:`Weverse.PollScheduler` with `min_poll_interval` and `max_poll_interval`.
+    min_poll_interval: float
+        The shortest wait in seconds between checks for new notifications. Defaults to 10.
+    max_poll_interval: float
+        The longest wait in seconds between checks for new notifications. Defaults to 120.
+        The notifications are fully fetched at least this often, even if Weverse reports nothing new.
+    json_executor_threshold: int
+        The size in bytes from which the asynchronous client decodes a response in an executor
+        instead of on the event loop. Defaults to 1048576 (1 MiB).
+    event_bus: :class:`Weverse.EventBus`
+        The bus that new posts, artist comments, media, and announcements are published to.
+        Defaults to a new :class:`Weverse.EventBus`.
+    rate_limiter: :class:`Weverse.RateLimiter`
+        Limits the requests of the client and retries the requests that Weverse rate-limited.
+        Defaults to a :class:`Weverse.RateLimiter` made from `rate_limit`, `rate_limit_burst`,
+        `endpoint_rate_limits`, and `max_rate_limit_retries`.
+    rate_limit: float
+        The most requests per second of the client. Defaults to no limit.
+    rate_limit_burst: float
+        The most requests that may be made at once after a quiet period. At least 1.
+        Defaults to `rate_limit`, or 1 if it is below 1.
+    endpoint_rate_limits: Dict[str, Tuple[float, float]]
+        The (rate, burst) of endpoint families such as "notifications" or "posts".
+        See :class:`Weverse.RateLimiter`.
+    max_rate_limit_retries: int
+        How many times a request is retried after Weverse responded with 429 Too Many Requests.
+        :class:`Weverse.error.BeingRateLimited` is raised once they are used up. Defaults to 3.
+    retry_policy: :class:`Weverse.RetryPolicy`
+        Decides which requests are retried after a connection error, a timeout, or a server error,
+        and how long to wait in between. Defaults to a :class:`Weverse.RetryPolicy` with 3 attempts.
+    communities: Iterable[int]
+        Only load and report new notifications of these community IDs. Defaults to every community.
+        New notifications of other communities are held back and reported once their community is handled.
+        Lets several accounts share the communities, see :class:`Weverse.ShardCoordinator`.
 
     Attributes
     -----------
@@ -59,6 +158,7 @@ class WeverseClient:
         All notifications in cache where the Notification ID is the key and the value is the Notification Object
     all_photos: dict(Photo)
         All photos in cache where the Photo ID is the key and the value is the Photo Object
+        The photos of a LazyPost are added once they are decoded or looked up with `get_photo_by_id`.
     all_communities: dict(Community)
         All communities in cache where the Community ID is the key and the value is the Community Object
     all_media: dict(Media)
@@ -67,8 +167,24 @@ class WeverseClient:
          All tabs in cache where the Tab ID is the key and the value is the Tab Object
     all_videos: dict(Video)
         All videos in cache where the Video URL is the key and the value is the Video Object
+        The videos of a LazyPost are added once they are decoded or looked up with `get_video_by_url`.
     all_announcements: dict(Announcement)
         All announcements/notices in cache where the Announcement ID is the key and the value is the Announcement Object
+    post_watermarks: dict(int)
+        The newest Post ID of a community that was fully paginated where the Community ID is the key.
+    community_load_times: dict(float)
+        The amount of seconds it took to load the artists and tabs of a community where the Community ID is the key.
+    notification_watermark: :class:`datetime.datetime`
+        When the newest notification that was seen was notified.
+    event_bus: :class:`Weverse.EventBus`
+        Handlers subscribe to it by event type and community.
+        EX: `client.event_bus.subscribe(PostCreated, handler, community_id=14)`
+    rate_limiter: :class:`Weverse.RateLimiter`
+        Limits the requests of the client. Its token levels and counters are available with `stats()`.
+    retry_policy: :class:`Weverse.RetryPolicy`
+        The retry policy of every request. Methods that fetch content accept a `retry_policy` for a single call.
+    community_filter: Optional[set]
+        The community IDs that the client loads and reports new notifications of. None for every community.
    """
     def __init__(self, **kwargs):
         self.verbose = kwargs.get('verbose')
@@ -76,7 +192,17 @@ class WeverseClient:
         self.__token = kwargs.get('authorization')
         self.user_notifications = []
 
-        self._old_notifications = []
+        # notification id -> None, oldest first. Used as a bounded set of the notifications that were seen.
+        self._seen_notification_ids: OrderedDict = OrderedDict()
+        self._max_seen_notifications: int = kwargs.get("max_seen_notifications") or 10000
+        # new notifications of communities outside the community filter, by notification ID.
+        self._deferred_notifications: OrderedDict = OrderedDict()
+        max_held_notification_age = kwargs.get("max_held_notification_age")
+        self._max_held_notification_age: float = max_held_notification_age \
+            if max_held_notification_age is not None else 3600
+        self._max_replayed_notifications: int = kwargs.get("max_replayed_notifications") or 20
+        self._new_notifications: List[w_Notification] = []
+        self.notification_watermark: Optional[datetime] = None
         self._headers = self.__get_headers()
 
         self.__login_payload = {
@@ -106,18 +232,63 @@ class WeverseClient:
         self._api_all_communities_info_url = self._api_communities_url + "info/"
         self.cache_loaded = False
         self._user_endpoint = "https://weversewebapi.weverse.io/wapi/v1/users/me"
+        # hosts that connections are opened to when the client starts.
+        self._warm_up_urls = ["https://weversewebapi.weverse.io/", "https://accountapi.weverse.io/"]
+
+        self._cache_backend: CacheBackend = kwargs.get("cache_backend") or CacheBackend(kwargs.get("cache_limits"))
 
-        self.all_posts: Dict[int, w_Post] = {}
+        self.all_posts: Dict[int, w_Post] = self._cache_backend.create_store("posts", self)
         self.all_artists: Dict[int, w_Artist] = {}
-        self.all_comments: Dict[int, w_Comment] = {}
-        self.all_notifications: Dict[int, w_Notification] = {}
-        self.all_photos: Dict[int, w_Photo] = {}
+        # community user id -> Artist, since notifications and posts refer to artists by their community user id.
+        self._artists_by_community_user_id: Dict[int, w_Artist] = {}
+        self.all_comments: Dict[int, w_Comment] = self._cache_backend.create_store("comments", self)
+        self.all_notifications: Dict[int, w_Notification] = self._cache_backend.create_store("notifications", self)
+        self.all_photos: Dict[int, w_Photo] = self._cache_backend.create_store("photos", self)
         self.all_communities: Dict[int, w_Community] = {}
-        self.all_media: Dict[int, w_Media] = {}
+        self.all_media: Dict[int, w_Media] = self._cache_backend.create_store("media", self)
         self.all_tabs: Dict[int, w_Tab] = {}
         # Videos have the url as the key due to no unique ID.
-        self.all_videos: Dict[str, w_Video] = {}
-        self.all_announcements: Dict[int, w_Announcement] = {}
+        self.all_videos: Dict[str, w_Video] = self._cache_backend.create_store("videos", self)
+        # photo ID or video URL -> the lazy post that has not decoded them yet.
+        self._lazy_photo_posts: Dict[int, w_Post] = {}
+        self._lazy_video_posts: Dict[str, w_Post] = {}
+        self.all_announcements: Dict[int, w_Announcement] = self._cache_backend.create_store("announcements", self)
+        self.post_watermarks: Dict[int, int] = {}
+        # posts ordered by creation time per community id and per (community id, artist id).
+        self._community_post_times: Dict[int, TimeIndex] = {}
+        self._artist_post_times: Dict[tuple, TimeIndex] = {}
+        self.community_load_times: Dict[int, float] = {}
+
+        self._max_concurrent_requests: int = kwargs.get("max_concurrent_requests") or 10
+        self._max_concurrent_communities: int = kwargs.get("max_concurrent_communities") or 5
+        self._max_requests_per_host: int = kwargs.get("max_requests_per_host") or 10
+        self._connection_limit: int = kwargs.get("connection_limit") or 100
+        self._connection_limit_per_host: int = kwargs.get("connection_limit_per_host") or self._max_requests_per_host
+        self._keepalive_timeout: float = kwargs.get("keepalive_timeout") or 60
+        self._dns_cache_ttl: int = kwargs.get("dns_cache_ttl") or 300
+        self._request_timeout: Optional[float] = kwargs.get("request_timeout")
+        self._connect_timeout: float = kwargs.get("connect_timeout") or 10
+        warm_up_connections = kwargs.get("warm_up_connections")
+        self._warm_up_connections: int = warm_up_connections if warm_up_connections is not None else 2
+        self._snapshot_path: Optional[str] = kwargs.get("snapshot_path")
+        self._lazy_models: bool = bool(kwargs.get("lazy_models"))
+        self._json_decoder: Callable[[bytes], Any] = kwargs.get("json_decoder") or json.loads
+        self._json_executor_threshold: int = kwargs.get("json_executor_threshold") or 1048576
+
+        min_poll_interval = kwargs.get("min_poll_interval") or 10
+        max_poll_interval = kwargs.get("max_poll_interval") or max(min_poll_interval, 120)
+        self._poll_scheduler: PollScheduler = kwargs.get("poll_scheduler") or \
+            PollScheduler(min_poll_interval, max_poll_interval)
+
+        self.event_bus: EventBus = kwargs.get("event_bus") or EventBus(bool(self.verbose))
+        max_rate_limit_retries = kwargs.get("max_rate_limit_retries")
+        self.rate_limiter: RateLimiter = kwargs.get("rate_limiter") or RateLimiter(
+            kwargs.get("rate_limit"), kwargs.get("rate_limit_burst"), kwargs.get("endpoint_rate_limits"),
+            max_rate_limit_retries if max_rate_limit_retries is not None else 3)
+        self.retry_policy: RetryPolicy = kwargs.get("retry_policy") or RetryPolicy()
+        self._poll_retry_policy = self.retry_policy.copy(max_attempts=1)
+        self.community_filter: Optional[set] = set(kwargs["communities"]) \
+            if kwargs.get("communities") is not None else None
 
         self._hook = kwargs.get("hook")
         self._hook_loop = False
@@ -145,8 +316,157 @@ class WeverseClient:
         return "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEAu/OhimOynajYomJmBsNvQxSDwekunsp986l7s/zMN/8jHXFlTqT79ZOsOwzVdZcKnkWYXwJg4nhIFpaIsPzklQCImp2kfKUJQV3jzw7/Qtq6NrOOh9YBADr+b99SHYcc7E7cDHjGXgWlC5jEI9h80R822wBU0HcbODkAQ3uosvFhSq3gLpxwdimesZofkJ5ZbAmGIMj1GEWAfMGA49mxkv/cDFWry+6FM4mUW6A0301QUg4wK/8n6RrzRj1NUkevZj1smizHeqmBE+0BU5H/fR9HclErx3LMHlVlxSgEEEjNUx3B0bLO0OHppmEb4B3Tk1O3ZsquYyqZyb2lBTbrQwIDAQAB"
 
     def stop(self):
-        """Stop the hook loop."""
+        """Stop the hook loop and write any pending cache changes to the cache backend."""
         self._hook_loop = False
+        self.flush_cache()
+
+    def flush_cache(self):
+        """Write any pending cache changes to the cache backend."""
+        self._cache_backend.flush()
+
+    @property
+    def cache_stats(self) -> Dict[str, dict]:
+        """The hit, miss, and eviction counters of each cache where the cache name is the key."""
+        caches = {cache_name.replace("all_", ""): getattr(self, cache_name) for cache_name in self._snapshot_caches}
+        return {cache_name: cache.stats() for cache_name, cache in caches.items() if hasattr(cache, "stats")}
+
+    def _on_cache_eviction(self, cache_name: str, key, obj):
+        """
+        Remove the references to an object that was evicted from a cache so that it may be freed.
+
+        :param cache_name: The name of the cache the object was evicted from.
+        :param key: The key of the object.
+        :param obj: The object that was evicted.
+        """
+        if cache_name != "posts":
+            return
+
+        self._unindex_post(obj)
+
+        # the artist may already hold a newer object of the same post.
+        if obj.artist and obj.artist.posts.get(obj.id) is obj:
+            obj.artist.posts.discard(obj)
+
+        if isinstance(obj, w_LazyPost):
+            # forget the photos and videos that were never decoded, and do not decode the others now.
+            for photo_id in obj._raw_photo_ids():
+                if self._lazy_photo_posts.get(photo_id) is obj:
+                    del self._lazy_photo_posts[photo_id]
+            for video_url in obj._raw_video_urls():
+                if self._lazy_video_posts.get(video_url) is obj:
+                    del self._lazy_video_posts[video_url]
+            children = [child for name in ("photos", "videos", "artist_comments") if obj.is_loaded(name)
+                        for child in getattr(obj, name) or []]
+        else:
+            children = (obj.photos or []) + (obj.videos or []) + (obj.artist_comments or [])
+
+        for child in children:
+            if child.post is obj:
+                child.post = None
+
+    def save_snapshot(self, path: str):
+        """
+        Save the internal cache to a file so it can be restored with :ref:`load_snapshot` after a restart.
+
+        The references between objects (such as a post and its artist) are kept.
+        The file is first written next to the path and then moved over it, so an existing snapshot is never
+        left half-written.
+
+        :param path: The file path to save the snapshot to.
+        """
+        for cache_name in self._snapshot_caches:
+            cache = getattr(self, cache_name)
+            if isinstance(cache, MemoryCacheStore):
+                cache.evict_expired()  # expired objects should not come back on the next start.
+
+        # the garbage collector would otherwise repeatedly scan the objects that pickle creates on the way.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot = {
+                "version": self._snapshot_version,
+                "caches": {cache_name: dict(getattr(self, cache_name).items())
+                           for cache_name in self._snapshot_caches},
+                "post_watermarks": self.post_watermarks,
+                "seen_notification_ids": list(self._seen_notification_ids),
+                "notification_watermark": self.notification_watermark
+            }
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        os.replace(temp_path, path)
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Load the internal cache from a file created by :ref:`save_snapshot`.
+
+        Only load snapshots that were created by yourself, as the file is unpickled.
+
+        :param path: The file path to load the snapshot from.
+        :returns: (:class:`bool`) Whether the snapshot was loaded.
+        """
+        if not os.path.exists(path):
+            return False
+
+        # the garbage collector would otherwise repeatedly scan the objects being created.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, "rb") as file:
+                snapshot = pickle.load(file)
+
+            if not isinstance(snapshot, dict) or snapshot.get("version") != self._snapshot_version:
+                if self.verbose:
+                    print(f"WARNING (NOT CRITICAL): {path} is not a compatible snapshot and was not loaded.")
+                return False
+
+            self._restore_snapshot(snapshot)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return True
+
+    def _restore_snapshot(self, snapshot: dict):
+        """
+        Fill the caches and indexes from a snapshot that was unpickled.
+
+        :param snapshot: The snapshot created by :ref:`save_snapshot`.
+        """
+        for cache_name, objects in snapshot["caches"].items():
+            if cache_name in self._snapshot_caches:
+                cache = getattr(self, cache_name)
+                if isinstance(cache, MemoryCacheStore):
+                    cache.load(objects)  # skips the limit checks of every single object.
+                else:
+                    cache.update(objects)
+
+        for artist in self.all_artists.values():
+            self._artists_by_community_user_id[artist.community_user_id] = artist
+        self._index_posts(self.all_posts.values())
+        for post in self.all_posts.values():
+            if isinstance(post, w_LazyPost):
+                self._add_post_children_to_cache(post)
+
+        for community_id, post_id in snapshot.get("post_watermarks", {}).items():
+            self._update_post_watermark(community_id, post_id)
+
+        for notification_id in snapshot.get("seen_notification_ids", []):
+            self._mark_notification_seen(notification_id)
+        self._update_notification_watermark(snapshot.get("notification_watermark"))
+
+    @property
+    def _snapshot_version(self) -> int:
+        """The version of the snapshot format."""
+        return 3
+
+    @property
+    def _snapshot_caches(self) -> List[str]:
+        """The names of the caches that are stored in a snapshot."""
+        return ["all_communities", "all_artists", "all_tabs", "all_posts", "all_photos", "all_videos",
+                "all_comments", "all_notifications", "all_media", "all_announcements"]
 
     def _login(self, method):
         """
@@ -196,6 +516,15 @@ class WeverseClient:
             if seconds_passed > timeout:
                 self._set_exception(asyncio.exceptions.TimeoutError())
 
+    def handles_community(self, community_id: int) -> bool:
+        """
+        Whether the client loads and reports new notifications of a community.
+
+        :param community_id: The community ID.
+        :returns: False if the community is not in the `community_filter`.
+        """
+        return self.community_filter is None or community_id in self.community_filter
+
     def get_new_notifications(self) -> List[w_Notification]:
         """Will get the new notifications from the last notification check.
 
@@ -203,7 +532,113 @@ class WeverseClient:
 
         :returns: List[:ref:`Notification`]
         """
-        return [noti for noti in self.user_notifications if noti not in self._old_notifications]
+        return self._new_notifications
+
+    def _process_user_notifications(self, notifications: List[w_Notification]):
+        """
+        Add the notifications that were received to cache and remember which of them are new.
+
+        A notification is new if its ID was not seen before and it was not notified before the newest
+        notification that was seen, which keeps old notifications from being new again once their ID was forgotten.
+        New notifications of communities outside the `community_filter` are held back instead of being marked seen,
+        and become new once the client handles their community, a few at a time.
+        Held back notifications that became too old are dropped.
+
+        :param notifications: The notifications received from the endpoint.
+        """
+        watermark = self.notification_watermark
+        new_notifications = []
+
+        # notifications of communities outside the filter wait until the client handles their community.
+        for notification in list(self._deferred_notifications.values()):
+            notified_at = parse_timestamp(notification.notified_at)
+            if watermark and isinstance(notified_at, datetime) and \
+                    (watermark - notified_at).total_seconds() > self._max_held_notification_age:
+                del self._deferred_notifications[notification.id]  # too old to be reported as new.
+                continue
+
+            if len(new_notifications) < self._max_replayed_notifications and \
+                    self.handles_community(notification.community_id):
+                del self._deferred_notifications[notification.id]
+                self._mark_notification_seen(notification.id)
+                new_notifications.append(notification)
+
+        for notification in notifications:
+            self.all_notifications[notification.id] = notification
+            if notification.id in self._seen_notification_ids or notification.id in self._deferred_notifications:
+                continue
+
+            notified_at = parse_timestamp(notification.notified_at)
+            if isinstance(notified_at, datetime):
+                if watermark and notified_at < watermark:
+                    continue
+                self._update_notification_watermark(notified_at)
+
+            if not self.handles_community(notification.community_id):
+                self._deferred_notifications[notification.id] = notification
+                while len(self._deferred_notifications) > self._max_seen_notifications:
+                    self._deferred_notifications.popitem(last=False)
+                continue
+
+            self._mark_notification_seen(notification.id)
+            new_notifications.append(notification)
+
+        self.user_notifications = notifications
+        self._new_notifications = new_notifications
+
+    def _add_notification_contents_to_cache(self, notification_type: Optional[str], contents):
+        """
+        Add the comment, post, media, or announcement that a notification is about to cache.
+
+        :param notification_type: The type of the notification. See :ref:`determine_notification_type`.
+        :param contents: The artist comments, :ref:`Post`, :ref:`Media`, or :ref:`Announcement` of the notification.
+        :returns: The :ref:`Comment`, :ref:`Post`, :ref:`Media`, or :ref:`Announcement` that was added to cache.
+        """
+        if contents is None:
+            return
+
+        if notification_type == 'comment':
+            if not contents:
+                return
+            comment = contents[0]
+            comment.post = self.get_post_by_id(comment.post_id)
+            if comment.post:
+                if comment.post.artist_comments:
+                    comment.post.artist_comments.insert(0, comment)
+                else:
+                    comment.post.artist_comments = [comment]
+                self.all_posts[comment.post.id] = comment.post  # store the changed post again.
+            self.all_comments[comment.id] = comment
+            return comment
+        elif notification_type in ["tofans", "post"]:
+            self._add_posts_to_cache([contents])
+        elif notification_type == 'media':
+            self.all_media[contents.id] = contents
+        elif notification_type == 'announcement':
+            self.all_announcements[contents.id] = contents
+        else:
+            return
+        return contents
+
+    def _mark_notification_seen(self, notification_id: int):
+        """
+        Remember that a notification was seen and forget the oldest ones past the limit.
+
+        :param notification_id: The ID of the notification.
+        """
+        self._seen_notification_ids[notification_id] = None
+        while len(self._seen_notification_ids) > self._max_seen_notifications:
+            self._seen_notification_ids.popitem(last=False)
+
+    def _update_notification_watermark(self, notified_at: Optional[datetime]):
+        """
+        Keep track of when the newest notification that was seen was notified.
+
+        :param notified_at: When a notification was notified.
+        """
+        if notified_at is not None and (self.notification_watermark is None or
+                                        notified_at > self.notification_watermark):
+            self.notification_watermark = notified_at
 
     def check_status(self, status, url) -> bool:
         """
@@ -227,6 +662,15 @@ class WeverseClient:
             if self.verbose:
                 print("WARNING (NOT CRITICAL): " + url + " Failed to load. [Status: " + str(status) + "]")
 
+    def _decode_json(self, body: bytes):
+        """
+        Decode the body of an API response with the client's JSON decoder.
+
+        :param body: The body of the response.
+        :return: The decoded body.
+        """
+        return self._json_decoder(body)
+
     @staticmethod
     def process_community_artists_and_tabs(community, response_text_as_dict):
         """
@@ -240,6 +684,7 @@ class WeverseClient:
         community_tabs = response_text_as_dict.get('tabs')
 
         # create artist and tab objects under the community
+        existing_artists = {artist.id: artist for artist in community.artists}
         community.artists = create_artist_objects(community_artists)
         community.tabs = create_tab_objects(community_tabs)
 
@@ -247,6 +692,25 @@ class WeverseClient:
         for artist in community.artists:
             artist.community = community
 
+            # keep the posts of an artist that was already loaded (such as from a snapshot).
+            existing_artist = existing_artists.get(artist.id)
+            if existing_artist:
+                artist.posts = existing_artist.posts
+                for post in artist.posts:
+                    post.artist = artist
+
+    def _add_community_artists_and_tabs(self, community: w_Community):
+        """
+        Add the artists and tabs of a community to cache.
+
+        :param community: Community object
+        """
+        for artist in community.artists:
+            self.all_artists[artist.id] = artist
+            self._artists_by_community_user_id[artist.community_user_id] = artist
+        for tab in community.tabs:
+            self.all_tabs[tab.id] = tab
+
     def get_artist_by_id(self, artist_id) -> Optional[w_Artist]:
         """
         Get artist by their ID.
@@ -254,12 +718,7 @@ class WeverseClient:
         :param artist_id: The artist's ID
         :returns: Optional[:ref:`Artist`]
         """
-        artist = self.all_artists.get(artist_id)
-        if not artist:
-            for t_artist in self.all_artists.values():
-                if t_artist.community_user_id == artist_id:
-                    artist = t_artist
-        return artist
+        return self.all_artists.get(artist_id) or self._artists_by_community_user_id.get(artist_id)
 
     def get_tab_by_id(self, tab_id) -> Optional[w_Tab]:
         """
@@ -279,6 +738,29 @@ class WeverseClient:
         """
         return self.all_posts.get(post_id)
 
+    def posts_between(self, community_id: int, start=None, end=None, artist_id: int = None) -> List[w_Post]:
+        """
+        Get the cached posts of a community that were created in a time range.
+
+        :param community_id: Community ID
+        :param start: (:class:`datetime.datetime`) The time to start from, in UTC if it has no timezone.
+            Unbounded if None.
+        :param end: (:class:`datetime.datetime`) The time to end at (not included). Unbounded if None.
+        :param artist_id: Only get the posts of the artist with this Artist ID.
+        :returns: List[:ref:`Post`] from the oldest to the newest.
+        """
+        if artist_id is None:
+            time_index = self._community_post_times.get(community_id)
+        else:
+            time_index = self._artist_post_times.get((community_id, artist_id))
+        if not time_index:
+            return []
+
+        start = parse_timestamp(start).timestamp() if start is not None else None
+        end = parse_timestamp(end).timestamp() if end is not None else None
+        posts = [self.all_posts.get(post_id) for post_id in time_index.between(start, end)]
+        return [post for post in posts if post is not None]
+
     def get_comment_by_id(self, comment_id) -> Optional[w_Comment]:
         """
         Get a comment by the ID
@@ -303,7 +785,11 @@ class WeverseClient:
         :param photo_id: Photo ID
         :returns: Optional[:ref:`Photo`]
         """
-        return self.all_photos.get(photo_id)
+        photo = self.all_photos.get(photo_id)
+        if photo is None and photo_id in self._lazy_photo_posts:
+            self._load_lazy_post_children(self._lazy_photo_posts[photo_id])
+            photo = self.all_photos.get(photo_id)
+        return photo
 
     def get_video_by_url(self, video_url) -> Optional[w_Video]:
         """
@@ -312,7 +798,11 @@ class WeverseClient:
         :param video_url: URL of the video
         :return: Optional[:ref:`Video`]
         """
-        return self.all_videos.get(video_url)
+        video = self.all_videos.get(video_url)
+        if video is None and video_url in self._lazy_video_posts:
+            self._load_lazy_post_children(self._lazy_video_posts[video_url])
+            video = self.all_videos.get(video_url)
+        return video
 
     def get_community_by_id(self, community_id) -> Optional[w_Community]:
         """
@@ -353,6 +843,150 @@ class WeverseClient:
                 for photo in media.photos:
                     self.all_photos[photo.id] = photo
 
+    def _is_known_post(self, community_id: int, post_id: int) -> bool:
+        """
+        Check whether a post was already loaded, even if it is no longer in cache.
+
+        :param community_id: The ID of the community the post belongs to.
+        :param post_id: The ID of the post.
+        :returns: (:class:`bool`) Whether the post is known.
+        """
+        if post_id in self.all_posts:
+            return True
+
+        watermark = self.post_watermarks.get(community_id)
+        return watermark is not None and post_id is not None and post_id <= watermark
+
+    def _update_post_watermark(self, community_id: int, post_id: int):
+        """
+        Keep track of the newest known post of a community.
+
+        Should only be called once a community was paginated without gaps, since every older post is then
+        considered known.
+
+        :param community_id: The ID of the community the post belongs to.
+        :param post_id: The ID of the post.
+        """
+        if community_id is None or post_id is None:
+            return
+
+        watermark = self.post_watermarks.get(community_id)
+        if watermark is None or post_id > watermark:
+            self.post_watermarks[community_id] = post_id
+
+    def _index_post(self, post: w_Post):
+        """
+        Add a post to the time indexes of its community and artist.
+
+        :param post: The post to index.
+        """
+        # a lazy post should not be decoded just to be indexed.
+        created_at = post._raw_created_at() if isinstance(post, w_LazyPost) else post.created_at
+        if not isinstance(created_at, datetime):
+            return
+
+        timestamp = created_at.timestamp()
+        community_time_index = self._community_post_times.get(post.community_id)
+        if community_time_index is None:
+            community_time_index = self._community_post_times[post.community_id] = TimeIndex()
+        community_time_index.add(post.id, timestamp)
+
+        artist_id = post.artist.id if post.artist else post.artist_id
+        if artist_id is not None:
+            artist_time_index = self._artist_post_times.get((post.community_id, artist_id))
+            if artist_time_index is None:
+                artist_time_index = self._artist_post_times[(post.community_id, artist_id)] = TimeIndex()
+            artist_time_index.add(post.id, timestamp)
+
+    def _index_posts(self, posts: Iterable[w_Post]):
+        """
+        Add many posts to the time indexes of their community and artist, sorting each index only once.
+
+        :param posts: The posts to index.
+        """
+        community_entries: Dict[int, list] = {}
+        artist_entries: Dict[tuple, list] = {}
+        for post in posts:
+            created_at = post._raw_created_at() if isinstance(post, w_LazyPost) else post.created_at
+            if not isinstance(created_at, datetime):
+                continue
+
+            entry = (created_at.timestamp(), post.id)
+            community_entries.setdefault(post.community_id, []).append(entry)
+            artist_id = post.artist.id if post.artist else post.artist_id
+            if artist_id is not None:
+                artist_entries.setdefault((post.community_id, artist_id), []).append(entry)
+
+        for time_indexes, entries_by_key in ((self._community_post_times, community_entries),
+                                             (self._artist_post_times, artist_entries)):
+            for key, entries in entries_by_key.items():
+                time_index = time_indexes.get(key)
+                if time_index is None:
+                    time_index = time_indexes[key] = TimeIndex()
+                time_index.add_many(entries)
+
+    def _unindex_post(self, post: w_Post):
+        """
+        Remove a post from the time indexes of its community and artist.
+
+        :param post: The post to remove.
+        """
+        community_time_index = self._community_post_times.get(post.community_id)
+        if community_time_index:
+            community_time_index.remove(post.id)
+
+        artist_id = post.artist.id if post.artist else post.artist_id
+        artist_time_index = self._artist_post_times.get((post.community_id, artist_id))
+        if artist_time_index:
+            artist_time_index.remove(post.id)
+
+    def _add_posts_to_cache(self, post_objects: List[w_Post]):
+        """
+        Will add post objects and their photos and videos to cache.
+
+        :param post_objects:
+        """
+        for post in post_objects:
+            self.all_posts[post.id] = post
+            self._index_post(post)
+            self._add_post_children_to_cache(post)
+
+    def _add_post_children_to_cache(self, post: w_Post):
+        """
+        Add the photos and videos of a post to cache.
+
+        The photos and videos of a lazy post that were not decoded yet are only remembered by ID or URL,
+        and are decoded once one of them is looked up.
+
+        :param post: The post.
+        """
+        if isinstance(post, w_LazyPost) and not post.is_loaded('photos'):
+            for photo_id in post._raw_photo_ids():
+                self._lazy_photo_posts[photo_id] = post
+        elif post.photos:
+            for photo in post.photos:
+                self.all_photos[photo.id] = photo
+
+        if isinstance(post, w_LazyPost) and not post.is_loaded('videos'):
+            for video_url in post._raw_video_urls():
+                self._lazy_video_posts[video_url] = post
+        elif post.videos:
+            for video in post.videos:
+                self.all_videos[video.video_url] = video
+
+    def _load_lazy_post_children(self, post: w_LazyPost):
+        """
+        Decode the photos and videos of a lazy post and add them to cache.
+
+        :param post: The lazy post.
+        """
+        for photo in post.photos or []:
+            self.all_photos[photo.id] = photo
+            self._lazy_photo_posts.pop(photo.id, None)
+        for video in post.videos or []:
+            self.all_videos[video.video_url] = video
+            self._lazy_video_posts.pop(video.video_url, None)
+
     def __get_encrypted_password(self, password):
         """
         Get the encrypted password from Weverse's public key.
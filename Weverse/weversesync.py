@@ -1,12 +1,14 @@
-import json
 import time
+from contextlib import contextmanager
 from typing import Optional, List
 
 import requests
+from requests.adapters import HTTPAdapter
 from .models import Community, Post as w_Post, Notification, Announcement
+from .retry import RetryPolicy
 from . import WeverseClient, create_post_objects, create_community_objects, create_notification_objects, \
     create_comment_objects, create_media_object, iterate_community_media_categories, create_announcement_object, \
-    InvalidCredentials, LoginFailed, InvalidToken, NoHookFound, check_expired_token
+    InvalidCredentials, LoginFailed, InvalidToken, NoHookFound, BeingRateLimited, check_expired_token
 
 
 class WeverseClientSync(WeverseClient):
@@ -44,7 +46,8 @@ class WeverseClientSync(WeverseClient):
         """
         try:
             if not self.web_session:
-                self.web_session = requests.Session()
+                self.web_session = self._create_web_session()
+                self.warm_up()
 
             if not self._login_info_exists and not self._token_exists:
                 raise InvalidCredentials
@@ -55,6 +58,9 @@ class WeverseClientSync(WeverseClient):
             if not self.check_token_works():
                 raise InvalidToken
 
+            # start from the cache of a previous run if one exists.
+            snapshot_loaded = bool(self._snapshot_path) and self.load_snapshot(self._snapshot_path)
+
             # create all communities that are subscribed to
             self.create_communities()  # communities should be created no matter what
 
@@ -66,15 +72,21 @@ class WeverseClientSync(WeverseClient):
                 self.get_user_notifications()
 
             for community in self.all_communities.values():
+                if not self.handles_community(community.id):
+                    continue
                 # load up posts
+                # posts restored from a snapshot only need the ones that were created since.
                 if create_old_posts:
-                    self.create_posts(community)
+                    self.create_posts(community, incremental=snapshot_loaded)
 
                 if create_media:
                     self.create_media(community)
 
             self.cache_loaded = True
 
+            if self._snapshot_path:
+                self.save_snapshot(self._snapshot_path)
+
             if self._hook:
                 if self.verbose:
                     print("Starting Notification Loop for Weverse Client.")
@@ -82,6 +94,31 @@ class WeverseClientSync(WeverseClient):
         except Exception as err:
             raise err
 
+    def _create_web_session(self) -> requests.Session:
+        """Create a requests session with the connection settings of the client."""
+        session = requests.Session()
+        # requests pools connections per host and has no limit across hosts.
+        adapter = HTTPAdapter(pool_maxsize=self._connection_limit_per_host)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def warm_up(self):
+        """Open a connection to each Weverse host ahead of time so that it can be reused by the first request.
+
+        A failed connection is not an error, since the request that needs it will connect again.
+        """
+        if not self._warm_up_connections:
+            return
+
+        for url in self._warm_up_urls:
+            try:
+                with self.web_session.request("HEAD", url, timeout=(self._connect_timeout, self._request_timeout)):
+                    pass
+            except Exception as e:
+                if self.verbose:
+                    print(f"Could not open a connection to {url} ahead of time - {e!r}")
+
     def _start_loop_for_hook(self):
         """
         Start checking for new notifications in a new loop and call the hook with the list of new Notifications
@@ -91,14 +128,85 @@ class WeverseClientSync(WeverseClient):
             raise NoHookFound
 
         self._hook_loop = True
+        last_full_check = time.monotonic()
         while self._hook_loop:
-            time.sleep(30)
-            new_notifications = self.update_cache_from_notification()
+            time.sleep(self._poll_scheduler.next_delay())
+
+            # the has-new endpoint is cheap but not always accurate, so a full check still happens every so often.
+            try:
+                has_new = self._has_new_notifications()
+            except Exception as e:
+                has_new = None  # unknown, so the notifications are fully fetched.
+                if self.verbose:
+                    print(f"Failed to check for new Weverse notifications - {e!r}")
+
+            new_notifications = []
+            if has_new is not False or time.monotonic() - last_full_check >= self._poll_scheduler.max_interval:
+                last_full_check = time.monotonic()
+                new_notifications = self.update_cache_from_notification()
+
+            self._poll_scheduler.record(bool(new_notifications))
             if not new_notifications:
                 continue
 
             self._hook(new_notifications)
 
+    @contextmanager
+    def _request(self, method: str, url: str, retry_policy: RetryPolicy = None, **kwargs):
+        """Make a request to Weverse while respecting the rate limiter.
+
+        A request that Weverse rate-limited is retried after its `Retry-After`, and a request that failed
+        for a transient reason is retried as the retry policy allows.
+        Should be used as a context manager that gives the response.
+
+        :param method: The HTTP method to use.
+        :param url: The url to request.
+        :param retry_policy: The :class:`Weverse.RetryPolicy` to use instead of the client's.
+        :param kwargs: Keyword arguments to pass into the web session's request.
+        :raises: :class:`Weverse.error.BeingRateLimited`
+            If the request was still rate-limited after the retries.
+        """
+        retry_policy = retry_policy or self.retry_policy
+        kwargs.setdefault("timeout", (self._connect_timeout, self._request_timeout))
+        attempt = rate_limited = 0
+        while True:
+            self.rate_limiter.acquire_sync(url)
+            attempt += 1
+            responded = False
+            try:
+                with self.web_session.request(method, url, **kwargs) as resp:
+                    if resp.status_code == 429:
+                        rate_limited += 1
+                        attempt -= 1  # rate-limited requests have their own budget.
+                        retry_after = self.rate_limiter.record_rate_limited(resp.headers.get("Retry-After"))
+                        if rate_limited > self.rate_limiter.max_retries:
+                            raise BeingRateLimited
+                        self.rate_limiter.retries += 1
+                        if self.verbose:
+                            print(f"WARNING: Weverse rate-limited {url}. Retrying in {retry_after} seconds.")
+                        continue
+
+                    if not retry_policy.should_retry_status(method, resp.status_code, attempt):
+                        responded = True
+                        yield resp
+                        return
+
+                    if self.verbose:
+                        print(f"WARNING: {url} responded with {resp.status_code}. Retrying.")
+            except Exception as e:
+                if responded or not retry_policy.should_retry_exception(method, e, attempt):
+                    raise
+                if self.verbose:
+                    print(f"WARNING: Request to {url} failed - {e!r}. Retrying.")
+            time.sleep(retry_policy.delay(attempt))
+
+    def _read_json(self, resp):
+        """Decode the JSON body of a response with the client's JSON decoder.
+
+        :param resp: The response to decode.
+        """
+        return self._decode_json(resp.content)
+
     def _try_login(self):
         """
         Will attempt to login to Weverse and set refresh token and token.
@@ -113,9 +221,9 @@ class WeverseClientSync(WeverseClient):
         login_payload: dict
             The client's login payload
         """
-        with self.web_session.post(url=self._login_url, json=login_payload) as resp:
+        with self._request("POST", url=self._login_url, json=login_payload) as resp:
             if self.check_status(resp.status_code, self._login_url):
-                data = json.loads(resp.text)
+                data = self._read_json(resp)
                 refresh_token = data.get("refresh_token")
                 token = data.get("access_token")
                 if refresh_token:
@@ -130,9 +238,9 @@ class WeverseClientSync(WeverseClient):
         """
         Refresh a token while logged in.
         """
-        with self.web_session.post(url=self._login_url, json=self._refresh_payload) as resp:
+        with self._request("POST", url=self._login_url, json=self._refresh_payload) as resp:
             if self.check_status(resp.status_code, self._login_url):
-                data = json.loads(resp.text)
+                data = self._read_json(resp)
                 token = data.get("access_token")
                 if token:
                     self._set_token(token)
@@ -167,14 +275,17 @@ class WeverseClientSync(WeverseClient):
         :parameter community: :ref:`Community` the posts exist under.
         """
         media_tab_url = f"{self._api_stream_url}{community.id}/{self._api_media_tab}"
-        with self.web_session.get(media_tab_url, headers=self._headers) as resp:
+        with self._request("GET", media_tab_url, headers=self._headers) as resp:
             if self.check_status(resp.status_code, media_tab_url):
-                response_text_as_dict = json.loads(resp.text)
+                response_text_as_dict = self._read_json(resp)
                 media_objects, photo_media_dicts = iterate_community_media_categories(response_text_as_dict)
 
                 # This endpoint does NOT give us any information about the photos, therefore we must make
                 # a separate api call to retrieve proper photo information for the photo media.
                 for media in photo_media_dicts:
+                    if media.get("id") in self.all_media:
+                        continue
+
                     media_obj = self.fetch_media(community.id, media.get("id"))
                     if media_obj:
                         media_objects.append(media_obj)
@@ -184,68 +295,112 @@ class WeverseClientSync(WeverseClient):
     @check_expired_token
     def create_communities(self):
         """Get and Create the communities the logged in user has access to."""
-        with self.web_session.get(self._api_communities_url, headers=self._headers) as resp:
+        with self._request("GET", self._api_communities_url, headers=self._headers) as resp:
             if self.check_status(resp.status_code, self._api_communities_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
+                response_text_as_dict = self._read_json(resp)
                 user_communities = response_text_as_dict.get("communities")
-                self.all_communities = create_community_objects(user_communities)
+                self.all_communities = create_community_objects(user_communities, self.all_communities)
 
     @check_expired_token
     def create_community_artists_and_tabs(self):
         """Create the community artists and tabs and add them to their respective communities."""
         for community in self.all_communities.values():
+            if not self.handles_community(community.id):
+                continue
             url = self._api_communities_url + str(community.id)
-            with self.web_session.get(url, headers=self._headers) as resp:
+            with self._request("GET", url, headers=self._headers) as resp:
                 if self.check_status(resp.status_code, url):
-                    response_text = resp.text
-                    response_text_as_dict = json.loads(response_text)
+                    response_text_as_dict = self._read_json(resp)
                     self.process_community_artists_and_tabs(community, response_text_as_dict)
-                    for artist in community.artists:
-                        self.all_artists[artist.id] = artist
-                    for tab in community.tabs:
-                        self.all_tabs[tab.id] = tab
+                    self._add_community_artists_and_tabs(community)
 
-    @check_expired_token
-    def create_posts(self, community: Community, next_page_id: int = None):
+    def create_posts(self, community: Community, next_page_id: int = None, incremental=False):
         """Paginate through a community's posts and add it to object cache.
 
         :parameter community: :ref:`Community` the posts exist under.
         :parameter [OPTIONAL] next_page_id: Next Page ID (Weverse paginates posts).
+        :parameter [OPTIONAL] incremental: Only add posts that are not known yet and stop paginating as soon as
+            a page only contains known posts.
+        """
+        newest_post_id = None
+        for response_text_as_dict in self._iter_post_page_data(community, next_page_id):
+            page_posts = response_text_as_dict.get('posts') or []
+            if incremental:
+                page_posts = [post for post in page_posts if not self._is_known_post(community.id, post.get('id'))]
+
+            posts = create_post_objects(page_posts, community,
+                                        add_to_artist=self._cache_backend.keeps_objects_in_memory,
+                                        lazy=self._lazy_models)
+            self._add_posts_to_cache(posts)
+            newest_post_id = max([post.id for post in posts if post.id] + [newest_post_id or 0]) or None
+
+            if response_text_as_dict.get('isEnded') or (incremental and not page_posts):
+                # every post of the community was seen, so the newest one may become the watermark.
+                if not next_page_id:
+                    self._update_post_watermark(community.id, newest_post_id)
+                break
+
+    def iter_post_pages(self, community: Community, next_page_id: int = None):
+        """Iterate through a community's posts one page at a time.
+
+        The posts are NOT added to the object cache, which allows the history of a community to be streamed
+        without holding all of it in memory.
+
+        :parameter community: :ref:`Community` the posts exist under.
+        :parameter [OPTIONAL] next_page_id: Page ID to start from (Weverse paginates posts).
+        :returns: An iterator of List[:ref:`Post`]
+        """
+        for response_text_as_dict in self._iter_post_page_data(community, next_page_id):
+            yield create_post_objects(response_text_as_dict.get('posts'), community, add_to_artist=False,
+                                      lazy=self._lazy_models)
+
+    def _iter_post_page_data(self, community: Community, next_page_id: int = None):
+        """Iterate through the raw pages of a community's posts.
+
+        :parameter community: :ref:`Community` the posts exist under.
+        :parameter [OPTIONAL] next_page_id: Page ID to start from.
+        :returns: An iterator of dict
+        """
+        while True:
+            response_text_as_dict = self._fetch_post_page(community, next_page_id)
+            if not response_text_as_dict:
+                return
+
+            yield response_text_as_dict
+            next_page_id = response_text_as_dict.get('lastId')
+            if response_text_as_dict.get('isEnded') or not next_page_id:
+                return
+
+    @check_expired_token
+    def _fetch_post_page(self, community: Community, next_page_id: int = None) -> Optional[dict]:
+        """Fetch a single page of a community's posts.
+
+        :parameter community: :ref:`Community` the posts exist under.
+        :parameter [OPTIONAL] next_page_id: Next Page ID (Weverse paginates posts).
+        :returns: Optional[dict]
         """
         artist_tab_url = self._api_communities_url + str(community.id) + '/' + self._api_all_artist_posts_url
         if next_page_id:
             artist_tab_url = artist_tab_url + "?from=" + str(next_page_id)
-        with self.web_session.get(artist_tab_url, headers=self._headers) as resp:
+        with self._request("GET", artist_tab_url, headers=self._headers) as resp:
             if self.check_status(resp.status_code, artist_tab_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
-                posts = create_post_objects(response_text_as_dict.get('posts'), community)
-                for post in posts:
-                    self.all_posts[post.id] = post
-                    if post.photos:
-                        for photo in post.photos:
-                            self.all_photos[photo.id] = photo
-
-                    if post.videos:
-                        for video in post.photos:
-                            self.all_videos[video.video_url] = video
-                if not response_text_as_dict.get('isEnded'):
-                    self.create_posts(community, response_text_as_dict.get('lastId'))
+                return self._read_json(resp)
 
     @check_expired_token
-    def create_post(self, community: Community, post_id) -> w_Post:
+    def create_post(self, community: Community, post_id, retry_policy: RetryPolicy = None) -> w_Post:
         """Create a post and update the cache with it. This is meant for an individual post.
 
         :parameter community: :ref:`Community` the post was created under.
         :parameter post_id: The id of the post we are needing to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         """
         post_url = self._api_communities_url + str(community.id) + '/posts/' + str(post_id)
-        with self.web_session.get(post_url, headers=self._headers) as resp:
+        with self._request("GET", post_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status_code, post_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
-                return (create_post_objects([response_text_as_dict], community, new=True))[0]
+                response_text_as_dict = self._read_json(resp)
+                return (create_post_objects([response_text_as_dict], community, new=True,
+                                            add_to_artist=self._cache_backend.keeps_objects_in_memory,
+                                            lazy=self._lazy_models))[0]
 
     @check_expired_token
     def get_user_notifications(self):
@@ -253,15 +408,25 @@ class WeverseClientSync(WeverseClient):
 
         :returns: List[:ref:`Notification`]
         """
-        with self.web_session.get(self._api_notifications_url, headers=self._headers) as resp:
+        with self._request("GET", self._api_notifications_url, headers=self._headers) as resp:
             if self.check_status(resp.status_code, self._api_notifications_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
-                self.user_notifications = create_notification_objects(response_text_as_dict.get('notifications'))
-                for user_notification in self.user_notifications:
-                    self.all_notifications[user_notification.id] = user_notification
+                response_text_as_dict = self._read_json(resp)
+                notifications = create_notification_objects(response_text_as_dict.get('notifications'))
+                self._process_user_notifications(notifications)
                 return self.user_notifications
 
+    @check_expired_token
+    def _has_new_notifications(self) -> Optional[bool]:
+        """Ask Weverse whether there is a new user notification without fetching the notifications.
+
+        :returns: Optional[:class:`bool`] None if it could not be determined.
+        """
+        # the next poll is a better retry than waiting here.
+        with self._request("GET", self._api_new_notifications_url, headers=self._headers,
+                           retry_policy=self._poll_retry_policy) as resp:
+            if self.check_status(resp.status_code, self._api_new_notifications_url):
+                return self._read_json(resp).get('has_new')
+
     @check_expired_token
     def check_new_user_notifications(self):
         """Checks if there is a new user notification, updates the cache, and returns if there was.
@@ -271,19 +436,15 @@ class WeverseClientSync(WeverseClient):
         This endpoint has been acting a bit off and not producing accurate results. It would be recommended to
         instantly get new notifications with :ref:`update_cache_from_notification` instead.
         """
-        with self.web_session.get(self._api_new_notifications_url, headers=self._headers) as resp:
-            if self.check_status(resp.status_code, self._api_new_notifications_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
-                has_new = response_text_as_dict.get('has_new')
-                if has_new:
-                    # update cache
-                    # Not that cache_loaded necessarily matters here,
-                    # but just in case other checks are happening concurrently.
-                    self.cache_loaded = False
-                    self.update_cache_from_notification()
-                    self.cache_loaded = True
-                return has_new
+        has_new = self._has_new_notifications()
+        if has_new:
+            # update cache
+            # Not that cache_loaded necessarily matters here,
+            # but just in case other checks are happening concurrently.
+            self.cache_loaded = False
+            self.update_cache_from_notification()
+            self.cache_loaded = True
+        return has_new
 
     @check_expired_token
     def translate(self, post_or_comment_id, is_post=False, is_comment=False, p_obj=None, community_id=None):
@@ -321,76 +482,77 @@ class WeverseClientSync(WeverseClient):
                 return None
         url = self._api_communities_url + str(community_id) + "/" + method_url + str(
             post_or_comment_id) + "/translate?languageCode=en"
-        with self.web_session.get(url, headers=self._headers) as resp:
+        with self._request("GET", url, headers=self._headers) as resp:
             if self.check_status(resp.status_code, url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
+                response_text_as_dict = self._read_json(resp)
                 return response_text_as_dict.get('translation')
 
     @check_expired_token
-    def fetch_artist_comments(self, community_id, post_id):
+    def fetch_artist_comments(self, community_id, post_id, retry_policy: RetryPolicy = None):
         """Fetches the artist comments on a post.
 
         :parameter community_id: Community ID the post is on.
         :parameter post_id: Post ID to fetch the artist comments of.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: List[:ref:`Comment`]
         """
         post_comments_url = self._api_communities_url + str(community_id) + '/posts/' + str(post_id) + "/comments/"
-        with self.web_session.get(post_comments_url, headers=self._headers) as resp:
+        with self._request("GET", post_comments_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status_code, post_comments_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
+                response_text_as_dict = self._read_json(resp)
                 return create_comment_objects(response_text_as_dict.get('artistComments'))
 
     @check_expired_token
-    def fetch_comment_body(self, community_id, comment_id):
+    def fetch_comment_body(self, community_id, comment_id, retry_policy: RetryPolicy = None):
         """Fetches a comment from its ID.
 
         :parameter community_id: The ID of the community the comment belongs to.
         :parameter comment_id: The ID of the comment to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: (:class:`str`) Body of the comment.
         """
         comment_url = f"{self._api_communities_url}{str(community_id)}/comments/{comment_id}/"
-        with self.web_session.get(comment_url, headers=self._headers) as resp:
+        with self._request("GET", comment_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status_code, comment_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
+                response_text_as_dict = self._read_json(resp)
                 return response_text_as_dict.get('body')
 
     @check_expired_token
-    def fetch_media(self, community_id, media_id):
+    def fetch_media(self, community_id, media_id, retry_policy: RetryPolicy = None):
         """Receive media object based on media id.
 
         :parameter community_id: The ID of the community the media belongs to.
         :parameter media_id: The ID of the media to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: :ref:`Media` or NoneType
         """
         media_url = self._api_communities_url + str(community_id) + "/medias/" + str(media_id)
-        with self.web_session.get(media_url, headers=self._headers) as resp:
+        with self._request("GET", media_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status_code, media_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
+                response_text_as_dict = self._read_json(resp)
                 return create_media_object(response_text_as_dict.get('media'))
 
     @check_expired_token
-    def fetch_announcement(self, community_id: int, announcement_id: int) -> Optional[Announcement]:
+    def fetch_announcement(self, community_id: int, announcement_id: int,
+                           retry_policy: RetryPolicy = None) -> Optional[Announcement]:
         """Receive announcement object based on announcement id.
 
         :parameter community_id: The ID of the community the media belongs to.
         :parameter announcement_id: The ID of the announcement to fetch.
+        :parameter [OPTIONAL] retry_policy: :class:`Weverse.RetryPolicy` to use instead of the client's.
         :returns: :ref:`Announcement` or NoneType
         """
         announcement_url = self._api_communities_url + str(community_id) + "/notices/" + str(announcement_id)
-        with self.web_session.get(announcement_url, headers=self._headers) as resp:
+        with self._request("GET", announcement_url, headers=self._headers, retry_policy=retry_policy) as resp:
             if self.check_status(resp.status_code, announcement_url):
-                response_text = resp.text
-                response_text_as_dict = json.loads(response_text)
+                response_text_as_dict = self._read_json(resp)
                 return create_announcement_object(response_text_as_dict)
 
     def update_cache_from_notification(self) -> List[Notification]:
         """Grab a new post based from new notifications and add it to cache.
 
         Will also return the new notifications found.
+        A notification whose contents could not be fetched is still returned.
 
         :returns: List[:class:`models.Notification`]
         """
@@ -401,45 +563,45 @@ class WeverseClientSync(WeverseClient):
                 return new_notifications
 
             new_notifications = self.get_new_notifications()
-            for notification in new_notifications:
-                self.__manage_notification_posts(notification)
-
         except Exception as e:
             if self.verbose:
                 print(f"Failed to update Weverse Cache - {e}")
+            return new_notifications
+
+        for notification in new_notifications:
+            try:
+                notification_type, contents = self.__fetch_notification_contents(notification)
+                contents = self._add_notification_contents_to_cache(notification_type, contents)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to update Weverse Cache from notification {notification.id} - {e}")
+                continue
+
+            event = self.event_bus.create_event(notification_type, contents, notification)
+            if event:
+                self.event_bus.publish(event)
         return new_notifications
 
-    def __manage_notification_posts(self, notification: Notification):
+    def __fetch_notification_contents(self, notification: Notification):
         """
-        Manages the creation of Notification posts and comments.
+        Fetch the comment, post, media, or announcement that a notification is about.
 
-        :param notification: Notification to create comments and posts for.
+        :param notification: Notification to fetch the contents of.
+        :returns: A tuple of the notification type and the contents.
         """
         notification_type = self.determine_notification_type(notification.message)
         community = self.get_community_by_id(notification.community_id)
         if notification_type == 'comment':
-            artist_comments = self.fetch_artist_comments(notification.community_id, notification.contents_id)
-            comment = artist_comments[0]
-            comment.post = self.get_post_by_id(comment.post_id)
-            if comment.post:
-                if comment.post.artist_comments:
-                    comment.post.artist_comments.insert(0, comment)
-                else:
-                    comment.post.artist_comments = [comment]
-            self.all_comments[comment.id] = comment
-
+            contents = self.fetch_artist_comments(notification.community_id, notification.contents_id)
         elif notification_type in ["tofans", "post"]:
-            post = self.create_post(community, notification.contents_id)
-            if post:
-                self.all_posts[post.id] = post
+            contents = self.create_post(community, notification.contents_id)
         elif notification_type == 'media':
-            media = self.fetch_media(community.id, notification.contents_id)
-            if media:
-                self.all_media[media.id] = media
+            contents = self.fetch_media(community.id, notification.contents_id)
         elif notification_type == 'announcement':
-            announcement = self.fetch_announcement(community.id, notification.contents_id)
-            if announcement:
-                self.all_announcements[announcement.id] = announcement
+            contents = self.fetch_announcement(community.id, notification.contents_id)
+        else:
+            contents = None
+        return notification_type, contents
 
     def check_token_works(self):
         """
@@ -447,6 +609,6 @@ class WeverseClientSync(WeverseClient):
 
         :returns: (:class:`bool`) True if the token works.
         """
-        with self.web_session.get(url=self._user_endpoint, headers=self._headers) as resp:
+        with self._request("GET", url=self._user_endpoint, headers=self._headers) as resp:
             self._expired_token = not resp.status_code == 200
             return not self._expired_token
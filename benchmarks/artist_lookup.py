@@ -0,0 +1,53 @@
+"""
+artist_lookup.py
+
+
+Times get_artist_by_id when the artist is looked up by their community user id.
+
+Compares the scan over every artist that was used before with the community user id index of the client.
+
+Run from the root of the repository: python -m benchmarks.artist_lookup
+"""
+import random
+import timeit
+
+from Weverse import WeverseClientSync
+from Weverse.models import Artist, Community
+
+
+AMOUNT = 5000
+LOOKUPS = 10000
+
+
+def scan(client: WeverseClientSync, artist_id):
+    """How an artist was found by their community user id before the index."""
+    artist = client.all_artists.get(artist_id)
+    if not artist:
+        for t_artist in client.all_artists.values():
+            if t_artist.community_user_id == artist_id:
+                artist = t_artist
+    return artist
+
+
+def main():
+    client = WeverseClientSync(authorization="fake token")
+    community = Community(community_id=1)
+    community.artists = [Artist(artist_id=index, community_user_id=index + 1000000, community_id=1)
+                         for index in range(AMOUNT)]
+    client._add_community_artists_and_tabs(community)
+
+    random.seed(0)
+    community_user_ids = [random.randrange(AMOUNT) + 1000000 for _ in range(LOOKUPS)]
+
+    print(f"get_artist_by_id with {AMOUNT} artists, looked up by community user id:")
+    runs = {
+        "scan": (lambda: [scan(client, artist_id) for artist_id in community_user_ids], 1),
+        "index": (lambda: [client.get_artist_by_id(artist_id) for artist_id in community_user_ids], 10),
+    }
+    for name, (run, number) in runs.items():
+        best = min(timeit.repeat(run, number=number, repeat=3)) / number
+        print(f"  {name:<6} {best / LOOKUPS * 1e6:.2f} us/lookup")
+
+
+if __name__ == '__main__':
+    main()
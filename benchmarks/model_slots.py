@@ -0,0 +1,39 @@
+"""
+model_slots.py
+
+
+Measures the memory of a model object with tracemalloc, including the list that holds the objects.
+
+Run it on a checkout from before the models declared __slots__ to compare.
+
+Run from the root of the repository: python -m benchmarks.model_slots
+"""
+import tracemalloc
+
+from Weverse import models
+
+
+AMOUNT = 20000
+MODELS = ["Photo", "Notification", "Comment", "Artist", "Post", "Tab", "Media"]
+
+
+def bytes_per_object(model) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [model() for _ in range(AMOUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size / AMOUNT
+
+
+def main():
+    print(f"Memory per object ({AMOUNT} instances, incl. list overhead):")
+    for name in MODELS:
+        print(f"  {name:<13} {bytes_per_object(getattr(models, name)):.0f} bytes")
+
+
+if __name__ == '__main__':
+    main()
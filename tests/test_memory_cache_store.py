@@ -0,0 +1,15 @@
+import time
+
+from Weverse.cache import MemoryCacheStore
+
+
+def test_expired_object_is_not_in_store():
+    evicted = []
+    store = MemoryCacheStore(ttl=0.05, on_evict=lambda key, value: evicted.append(key))
+    store[1] = "post"
+    assert 1 in store
+
+    time.sleep(0.1)
+    assert 1 not in store
+    assert evicted == [1]
+    assert store.get(1) is None
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+from Weverse import WeverseClientSync
+from Weverse.cache import TimeIndex
+from Weverse.models import Community
+from Weverse.objects import create_post_objects
+
+
+def test_time_index_reuses_removed_entry():
+    index = TimeIndex()
+    index.add(1, 10)
+    index.remove(1)
+    index.add(1, 10)
+    assert index.between() == [1]
+
+    index.add(1, 20)
+    index.add(1, 10)
+    assert index.between() == [1]
+    assert len(index) == 1
+
+
+def test_evicted_post_is_listed_once_after_it_is_synced_again():
+    client = WeverseClientSync(authorization="fake token", cache_limits={"posts": {"max_size": 2}})
+    community = Community(community_id=1)
+    raw_posts = [{"id": post_id, "createdAt": f"2021-01-0{post_id}T00:00:00Z", "communityUser": {"id": 9}}
+                 for post_id in (1, 2, 3)]
+
+    client._add_posts_to_cache(create_post_objects(raw_posts, community, add_to_artist=False))
+    assert 1 not in client.all_posts  # evicted by the size limit.
+    client._add_posts_to_cache(create_post_objects(raw_posts[:1], community, add_to_artist=False))
+
+    posts = client.posts_between(1, start=datetime(2021, 1, 1, tzinfo=timezone.utc))
+    assert [post.id for post in posts] == [1, 3]